@@ -0,0 +1,37 @@
+#!/usr/bin/env python3
+"""
+Shared pytest fixtures for the real-data test scripts.
+
+The season export is processed once per test session and shared by every test
+that asks for it; tests are skipped when the export is not present.
+"""
+
+import os
+
+import pytest
+
+REAL_DATA_CSV = "data/season74/by_leg_export.csv"
+
+
+@pytest.fixture(scope="session")
+def config():
+    """Application configuration loaded once per session."""
+    from src.config import Config
+    return Config()
+
+
+@pytest.fixture(scope="session")
+def real_data_csv():
+    """Path to the real season export; tests using it skip when it is absent."""
+    if not os.path.exists(REAL_DATA_CSV):
+        pytest.skip(f"Real data export not found: {REAL_DATA_CSV}")
+    return REAL_DATA_CSV
+
+
+@pytest.fixture(scope="session")
+def results(real_data_csv):
+    """Processed results for the real season export (read-only)."""
+    # Imported here so runs without the export never pay for pandas and the
+    # processing modules; reused from the on-disk cache when unchanged
+    from processed_results_cache import load_cached
+    return load_cached(real_data_csv)
@@ -0,0 +1,80 @@
+#!/usr/bin/env python3
+"""
+Disk cache for processed DartConnect results used by the real-data test scripts.
+
+The test scripts re-run DataProcessor.process_file() on the same season CSV
+every time, re-parsing the CSV and rebuilding every derived table. This caches
+the complete results dictionary as a pickle keyed on the CSV path and
+modification time, so repeat runs against an unchanged export load it directly,
+and memoizes it in-process so repeat loads within one run are free.
+
+The key also includes a fingerprint of the processing code, so editing
+DataProcessor, the URL fetcher or the PDF generator rebuilds the results.
+"""
+
+import hashlib
+import logging
+import os
+from functools import lru_cache
+from pathlib import Path
+from typing import Any, Dict
+
+import pandas as pd
+
+from src.config import Config
+from src.data_processor import DataProcessor
+
+CACHE_DIR = Path("cache/processed_results")
+
+# Source files whose changes invalidate cached results
+CODE_FILES = [
+    Path(__file__).parent / "src" / name
+    for name in ("data_processor.py", "url_fetcher.py", "pdf_generator.py")
+]
+
+logger = logging.getLogger(__name__)
+
+
+def load_cached(csv_path: str) -> Dict[str, Any]:
+    """
+    Load processed results for a CSV, reusing the on-disk cache when it is current.
+
+    Results are also memoized in-process, so scripts that load the same export
+    more than once share one copy (callers should treat it as read-only).
+
+    Args:
+        csv_path: Path to the DartConnect export CSV
+
+    Returns:
+        Results dictionary as returned by DataProcessor.process_file()
+    """
+    source = os.path.abspath(csv_path)
+    return _load(source, os.path.getmtime(source))
+
+
+@lru_cache(maxsize=1)
+def _code_fingerprint() -> str:
+    """Hash of the processing code, so cached results follow code changes."""
+    digest = hashlib.md5()
+    for path in CODE_FILES:
+        digest.update(path.read_bytes())
+    return digest.hexdigest()
+
+
+@lru_cache(maxsize=4)
+def _load(source: str, mtime: float) -> Dict[str, Any]:
+    """Load results for a CSV at a given modification time (memoized)."""
+    key = hashlib.md5(f"{source}{mtime}{_code_fingerprint()}".encode()).hexdigest()
+    cache_file = CACHE_DIR / f"{key}.pkl"
+
+    if cache_file.exists():
+        try:
+            return pd.read_pickle(cache_file)
+        except Exception as e:
+            logger.warning(f"Ignoring unreadable results cache {cache_file}: {e}")
+
+    results = DataProcessor(Config()).process_file(source)
+
+    CACHE_DIR.mkdir(parents=True, exist_ok=True)
+    pd.to_pickle(results, cache_file)
+    return results
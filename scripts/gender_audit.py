@@ -48,6 +48,10 @@ UNISEX = {
 }
 
 
+# The only export columns the audit reads; the by_leg export has many more
+AUDIT_COLUMNS = ["M/F", "First Name", "Last Name, FI", "Team", "Division"]
+
+
 def norm(s: str) -> str:
     return (s or "").strip()
 
@@ -84,10 +88,11 @@ def likely_gender_from_first_name(first_name: str) -> str:
 
 
 def audit_gender(csv_path: Path) -> Tuple[pd.DataFrame, pd.DataFrame, pd.DataFrame]:
-    df = pd.read_csv(csv_path, dtype=str)
+    # Parse only the audited columns rather than the whole wide export
+    df = pd.read_csv(csv_path, dtype=str, usecols=lambda col: col in AUDIT_COLUMNS)
 
     # Normalize relevant columns
-    for col in ["M/F", "First Name", "Last Name, FI", "Team", "Division"]:
+    for col in AUDIT_COLUMNS:
         if col not in df.columns:
             df[col] = ""
     df["M/F"] = df["M/F"].fillna("").str.strip().str.upper()
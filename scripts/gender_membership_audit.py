@@ -14,6 +14,10 @@ from pathlib import Path
 import pandas as pd
 
 
+# The only export columns the audit reads; the by_leg export has many more
+AUDIT_COLUMNS = ["M/F", "Membership", "First Name", "Last Name, FI", "Team", "Division"]
+
+
 def bucket_membership(value: str) -> str:
     v = (value or "").strip().lower()
     if v == "":
@@ -36,10 +40,11 @@ def main():
     if not csv_path.exists():
         raise SystemExit(f"CSV not found: {csv_path}")
 
-    df = pd.read_csv(csv_path, dtype=str)
+    # Parse only the audited columns rather than the whole wide export
+    df = pd.read_csv(csv_path, dtype=str, usecols=lambda col: col in AUDIT_COLUMNS)
 
     # Ensure required columns exist
-    for col in ["M/F","Membership","First Name","Last Name, FI","Team","Division"]:
+    for col in AUDIT_COLUMNS:
         if col not in df.columns:
             df[col] = ""
 
@@ -177,6 +177,21 @@ UNISEX_NAMES = {
 # Placeholder names to exclude from reports
 PLACEHOLDER_NAMES = {"ghost", "placeholder", "test", "dummy"}
 
+# Text columns of the by_leg export. Reading them as strings lets the CSV
+# parser skip numeric type inference on them; absent columns are ignored.
+TEXT_COLUMNS = {
+    "First Name": str,
+    "Last Name, FI": str,
+    "M/F": str,
+    "Team": str,
+    "Division": str,
+    "PF": str,
+    "Game Name": str,
+    "Win": str,
+    "Report Link": str,
+    "Event Link": str,
+}
+
 
 class DataProcessor:
     """Processes DartConnect league data and calculates statistics."""
@@ -249,7 +264,7 @@ class DataProcessor:
 
         # Determine file format and load accordingly
         if file_path.suffix.lower() == ".csv":
-            df = pd.read_csv(file_path)
+            df = pd.read_csv(file_path, dtype=TEXT_COLUMNS)
         elif file_path.suffix.lower() in [".xlsx", ".xls"]:
             df = pd.read_excel(file_path)
         else:
@@ -786,19 +801,30 @@ class DataProcessor:
             self.logger.info("No report URLs found in data")
             return enhanced_data
 
-        # Get unique URLs to avoid duplicate fetching
-        unique_urls = df[df["report_url"].notna()]["report_url"].unique()
+        # Get unique URLs to avoid duplicate fetching: every leg row repeats its
+        # match URL, so this is one fetch per match rather than per leg.
+        # Selecting the column first avoids copying the whole filtered frame.
+        unique_urls = df["report_url"].dropna().drop_duplicates()
 
         self.logger.info(f"Processing {len(unique_urls)} unique DartConnect URLs")
 
         url_to_game_data = {}
 
-        # Fetch detailed data for each URL
+        # Convert match report URLs to game URL format if needed
+        game_urls = {}
         for url in unique_urls:
             try:
-                # Convert match report URL to game URL format if needed
-                game_url = self._convert_to_game_url(url)
-                game_data = self.url_fetcher.fetch_game_data(game_url)
+                game_urls[url] = self._convert_to_game_url(url)
+            except Exception as e:
+                self.logger.error(f"Failed to process URL {url}: {e}")
+                enhanced_data["urls_failed"] += 1
+
+        # Fetch detailed data for all URLs concurrently
+        fetched_game_data = self.url_fetcher.fetch_many(list(game_urls.values()))
+
+        for url, game_url in game_urls.items():
+            try:
+                game_data = fetched_game_data.get(game_url)
 
                 if game_data:
                     url_to_game_data[url] = game_data
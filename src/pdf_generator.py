@@ -697,17 +697,20 @@ class PDFGenerator:
                     player_name = player_data.get("name")
                     # Check if player is in this division (cross-reference with raw data)
                     if player_name in div_df["player_name"].values:
-                        for turn in player_data.get("turn_data", []):
-                            # Check for 6 bulls
-                            if turn.get("bulls", 0) >= 6:
-                                achievements["six_bulls"][player_name] = (
-                                    achievements["six_bulls"].get(player_name, 0) + 1
-                                )
-                            # Check for 9+ marks (9 hits)
-                            if turn.get("marks", 0) >= 9:
-                                achievements["nine_hits"][player_name] = (
-                                    achievements["nine_hits"].get(player_name, 0) + 1
-                                )
+                        # Turns with 6 bulls
+                        six_bull_turns = player_data.get("six_bull_turns", 0)
+                        if six_bull_turns:
+                            achievements["six_bulls"][player_name] = (
+                                achievements["six_bulls"].get(player_name, 0)
+                                + six_bull_turns
+                            )
+                        # Turns with 9+ marks (9 hits)
+                        nine_mark_turns = player_data.get("nine_mark_turns", 0)
+                        if nine_mark_turns:
+                            achievements["nine_hits"][player_name] = (
+                                achievements["nine_hits"].get(player_name, 0)
+                                + nine_mark_turns
+                            )
 
         return achievements
 
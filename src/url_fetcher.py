@@ -6,15 +6,263 @@ bulls and marks need to be combined for accurate QP scoring.
 """
 
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.request import ACCEPT_ENCODING
+from urllib3.util.retry import Retry
 import json
 import re
 import html
 import hashlib
+import bisect
+from concurrent.futures import Future, ProcessPoolExecutor, ThreadPoolExecutor
+from functools import lru_cache
+from itertools import chain
+from operator import itemgetter
+from collections import OrderedDict
 from pathlib import Path
-from datetime import datetime, timedelta
+from datetime import datetime
 from typing import Dict, List, Optional, Any
-from urllib.parse import urlparse
 import logging
+import os
+import time
+import threading
+
+try:
+    import orjson
+
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+try:
+    import ujson
+
+    UJSON_AVAILABLE = True
+except ImportError:
+    UJSON_AVAILABLE = False
+
+logger = logging.getLogger(__name__)
+
+
+def _loads_json(data) -> Any:
+    """Parse JSON from str or bytes, using orjson or ujson when installed."""
+    if ORJSON_AVAILABLE:
+        return orjson.loads(data)
+    if UJSON_AVAILABLE:
+        return ujson.loads(data)
+    return json.loads(data)
+
+
+def _unescape_attribute(value: str) -> str:
+    """Decode HTML entities in an attribute value.
+
+    The page JSON is normally escaped with only &quot; and &amp;, which two
+    str.replace calls handle far faster than html.unescape; anything else
+    falls back to the general unescaper.
+    """
+    unescaped = value.replace("&quot;", '"')
+    if "&" not in unescaped:
+        return unescaped
+    if unescaped.count("&") == unescaped.count("&amp;"):
+        return unescaped.replace("&amp;", "&")
+    return html.unescape(value)
+
+
+def _dumps_json(obj: Any) -> bytes:
+    """Serialize to compact UTF-8 JSON bytes, using orjson when it is installed."""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(obj)
+    return json.dumps(obj, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+
+# Opening of the attribute holding the page's JSON payload; searched for as
+# raw bytes so the surrounding HTML is never decoded
+_DATA_PAGE_MARKER = b'data-page="'
+
+# Page props used downstream: match metadata and the per-game turn data
+_GAME_DATA_PROPS = ("matchInfo", "segments")
+
+# Recap game pages: /games/<id> or /history/report/match/<id>
+_RECAP_URL_RE = re.compile(
+    r"https?://recap\.dartconnect\.com/(?:games|history/report/match)/[^/?#]+"
+)
+_RECAP_URL_PREFIXES = (
+    "https://recap.dartconnect.com/",
+    "http://recap.dartconnect.com/",
+)
+
+# (marks, bulls) scored by one cricket dart, keyed by its segment code.
+# SB = single bull (1 mark), DB = double bull (2 marks), bare B = single bull;
+# T/D/S on 15-20 score 3/2/1 marks. Anything else scores nothing.
+_DART_VALUES = {"B": (0, 1), "SB": (0, 1), "DB": (0, 2)}
+_DART_VALUES.update(
+    (f"{ring}{number}", (marks, 0))
+    for ring, marks in (("T", 3), ("D", 2), ("S", 1))
+    for number in range(15, 21)
+)
+
+
+def _cricket_turn_qp(marks: int, bulls: int) -> int:
+    """Calculate QP for a single turn based on marks and bulls.
+
+    QP Rules:
+    5 QP: 9H, 6B, 3H+4B, 6H+2B
+    4 QP: 8H, 5B, 2H+4B, 3H+3B, 5H+2B, 6H+1B
+    3 QP: 7H, 4B, 1H+4B, 2H+3B, 4H+2B, 5H+1B
+    2 QP: 6H, 3B, 1H+3B, 3H+2B, 4H+1B
+    1 QP: 5H, 3H+1B, 2H+2B
+
+    Only used to build _CRICKET_QP_TABLE at import time.
+    """
+    # QP Level 5
+    if (
+        marks >= 9
+        or bulls >= 6
+        or (marks >= 3 and bulls >= 4)
+        or (marks >= 6 and bulls >= 2)
+    ):
+        return 5
+
+    # QP Level 4
+    elif (
+        marks >= 8
+        or bulls >= 5
+        or (marks >= 2 and bulls >= 4)
+        or (marks >= 3 and bulls >= 3)
+        or (marks >= 5 and bulls >= 2)
+        or (marks >= 6 and bulls >= 1)
+    ):
+        return 4
+
+    # QP Level 3
+    elif (
+        marks >= 7
+        or bulls >= 4
+        or (marks >= 1 and bulls >= 4)
+        or (marks >= 2 and bulls >= 3)
+        or (marks >= 4 and bulls >= 2)
+        or (marks >= 5 and bulls >= 1)
+    ):
+        return 3
+
+    # QP Level 2
+    elif (
+        marks >= 6
+        or bulls >= 3
+        or (marks >= 1 and bulls >= 3)
+        or (marks >= 3 and bulls >= 2)
+        or (marks >= 4 and bulls >= 1)
+    ):
+        return 2
+
+    # QP Level 1
+    elif marks >= 5 or (marks >= 3 and bulls >= 1) or (marks >= 2 and bulls >= 2):
+        return 1
+
+    # No QP
+    else:
+        return 0
+
+
+# Every rule saturates at 9 marks / 6 bulls, so a table of that size covers
+# all turns; flattened row-major (marks * 7 + bulls) for a single index
+_MAX_QP_MARKS = 9
+_MAX_QP_BULLS = 6
+_CRICKET_QP_TABLE = tuple(
+    _cricket_turn_qp(m, b)
+    for m in range(_MAX_QP_MARKS + 1)
+    for b in range(_MAX_QP_BULLS + 1)
+)
+
+# Past the data-page attribute, drain at most this much of the page so the
+# connection can go back to the pool; larger remainders are dropped instead
+_MAX_DRAIN_BYTES = 512 * 1024
+
+# Connection pool size for the recap host, and the cap on fetch_many workers
+_MAX_CONCURRENT_FETCHES = 32
+
+# Below this many Cricket games, process pool startup costs more than the
+# parsing it would parallelize
+_PARALLEL_PARSE_MIN_GAMES = 200
+
+# 501 QP bands as lower bounds for bisect: a score below the first bound or
+# at/above the last one earns nothing
+_501_TOTAL_BOUNDS = (95, 116, 132, 148, 164, 181)
+_501_CHECKOUT_BOUNDS = (61, 85, 107, 129, 151, 171)
+_501_BAND_QP = (0, 1, 2, 3, 4, 5, 0)
+
+
+def _501_band_qp(bounds: tuple, score: float) -> int:
+    """Look up a score's 501 QP band.
+
+    Bands are inclusive integer ranges, so a non-integer score only counts
+    when it lies strictly inside one (115.5 falls between bands and earns 0).
+    """
+    try:
+        whole = int(score)
+    except (ValueError, OverflowError):  # NaN or infinite
+        return 0
+    qp = _501_BAND_QP[bisect.bisect_right(bounds, score)]
+    if whole != score and _501_BAND_QP[bisect.bisect_right(bounds, whole + 1)] != qp:
+        return 0
+    return qp
+
+
+# Per-turn 501 QP for every possible turn score (0-180), indexed directly
+_501_TURN_QP = tuple(
+    _501_BAND_QP[bisect.bisect_right(_501_TOTAL_BOUNDS, score)] for score in range(181)
+)
+
+
+@lru_cache(maxsize=4096)
+def _is_recap_url(url: str) -> bool:
+    """Recap URL check; memoized since the same URLs recur within a run."""
+    # Cheap prefix test rejects foreign hosts before the regex runs
+    return url.startswith(_RECAP_URL_PREFIXES) and _RECAP_URL_RE.match(url) is not None
+
+
+@lru_cache(maxsize=4096)
+def _cache_filename_for(url: str) -> str:
+    """Cache filename for a URL; memoized since each fetch looks it up twice."""
+    # Extract match ID from URL for readable filenames
+    match_id = None
+    if "/games/" in url:
+        match_id = url.split("/games/")[-1]
+    elif "/match/" in url:
+        match_id = url.split("/match/")[-1]
+
+    if match_id:
+        # Clean match ID of any query parameters
+        match_id = match_id.split("?")[0].split("#")[0]
+        return f"{match_id}.json"
+    else:
+        # Fallback to URL hash if we can't extract match ID
+        url_hash = hashlib.blake2b(url.encode(), digest_size=16).hexdigest()
+        return f"url_{url_hash}.json"
+
+
+class _CricketPlayerStats:
+    """Per-player accumulator used while parsing a Cricket game.
+
+    Uses __slots__ so the per-turn updates are attribute reads/writes rather
+    than dict lookups; converted to a plain dict for the parsed game result.
+    """
+
+    __slots__ = ("name", "total_qp", "six_bull_turns", "nine_mark_turns")
+
+    def __init__(self, name: str):
+        self.name = name
+        self.total_qp = 0  # Sum of QPs from all qualifying turns
+        self.six_bull_turns = 0  # Turns with 6+ bull marks (achievement)
+        self.nine_mark_turns = 0  # Turns with 9+ marks (achievement)
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "name": self.name,
+            "total_qp": self.total_qp,
+            "six_bull_turns": self.six_bull_turns,
+            "nine_mark_turns": self.nine_mark_turns,
+        }
 
 
 class DartConnectURLFetcher:
@@ -25,6 +273,7 @@ class DartConnectURLFetcher:
         timeout: int = 30,
         cache_dir: str = "cache/dartconnect_urls",
         cache_expiry_days: int = 150,
+        memory_cache_size: int = 4096,
     ):
         """
         Initialize the URL fetcher.
@@ -33,25 +282,71 @@ class DartConnectURLFetcher:
             timeout: Request timeout in seconds
             cache_dir: Directory to store cached responses
             cache_expiry_days: Number of days before cache expires (default: 150 - about 5 months for dart season)
+            memory_cache_size: Maximum number of matches kept in the in-memory cache
         """
         self.timeout = timeout
         self.cache_dir = Path(cache_dir)
         self.cache_expiry_days = cache_expiry_days
+        self._expiry_seconds = cache_expiry_days * 86400
+        # Cache filename -> mtime, built lazily by _get_mtime_index()
+        self._mtime_index: Optional[Dict[str, float]] = None
         self.logger = logging.getLogger(__name__)
         self.session = requests.Session()
 
+        # Retry rate limits and transient 5xx responses with jittered
+        # exponential backoff, honouring Retry-After on 429 responses. A host
+        # that cannot be reached gets one reconnect and reads are never
+        # retried, so an offline or hung URL fails fast instead of waiting
+        # out every backoff and timeout
+        retry_strategy = Retry(
+            total=5,
+            connect=1,
+            read=0,
+            status=5,
+            backoff_factor=0.5,
+            backoff_jitter=0.5,
+            status_forcelist=[429, 500, 502, 503, 504],
+            allowed_methods=["GET"],
+            respect_retry_after_header=True,
+        )
+        # Larger connection pool so concurrent fetches reuse keep-alive
+        # sockets instead of discarding them and redoing TLS handshakes
+        adapter = HTTPAdapter(
+            pool_connections=_MAX_CONCURRENT_FETCHES,
+            pool_maxsize=_MAX_CONCURRENT_FETCHES,
+            pool_block=False,
+            max_retries=retry_strategy,
+        )
+        self.session.mount("http://", adapter)
+        self.session.mount("https://", adapter)
+
         # Create cache directory if it doesn't exist
         self.cache_dir.mkdir(parents=True, exist_ok=True)
 
-        # Set a proper user agent to avoid blocking
+        # Set a proper user agent to avoid blocking, and advertise every
+        # encoding urllib3 can decode here (adds br when brotli is installed)
         self.session.headers.update(
             {
-                "User-Agent": "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36"
+                "User-Agent": "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36",
+                "Accept-Encoding": ACCEPT_ENCODING,
             }
         )
 
         # Track cache stats for reporting
         self.cache_stats = {"hits": 0, "misses": 0, "expired": 0, "new_fetches": 0}
+        # fetch_many() workers update the counts concurrently
+        self._stats_lock = threading.Lock()
+
+        # In-memory LRU of game data by URL so repeated URLs within a run
+        # skip both the network and the disk cache read/parse
+        self._memory_cache: "OrderedDict[str, Dict[str, Any]]" = OrderedDict()
+        self._memory_cache_max = memory_cache_size
+        # fetch_many() calls fetch_game_data() from worker threads
+        self._memory_lock = threading.Lock()
+
+        # URL -> future resolved with the result of the thread loading that URL
+        self._inflight: Dict[str, Future] = {}
+        self._inflight_lock = threading.Lock()
 
     def fetch_game_data(self, url: str) -> Optional[Dict[str, Any]]:
         """
@@ -66,134 +361,230 @@ class DartConnectURLFetcher:
         try:
             # Validate URL format first
             if not self._is_valid_dartconnect_url(url):
-                self.logger.warning(f"Invalid DartConnect URL format: {url}")
+                self.logger.warning("Invalid DartConnect URL format: %s", url)
                 return None
 
-            # Check cache first
-            cached_data = self._get_cached_data(url)
-            if cached_data is not None:
-                self.cache_stats["hits"] += 1
+            # Check in-memory memo, then disk cache
+            memory_hit = self._recall(url)
+            if memory_hit is not None:
+                self._count_cache_stat("hits")
+                return memory_hit
+
+            # Only one thread loads a given URL; concurrent callers wait for
+            # it and share its result instead of fetching the page again
+            # (handed over directly, so it doesn't depend on the LRU keeping it)
+            with self._inflight_lock:
+                loading = self._inflight.get(url)
+                if loading is None:
+                    result: Future = Future()
+                    self._inflight[url] = result
+
+            if loading is not None:
+                game_data = loading.result()
+                if game_data is not None:
+                    self._count_cache_stat("hits")
+                return game_data
+
+            game_data = None
+            try:
+                game_data = self._load_game_data(url)
+                return game_data
+            finally:
+                with self._inflight_lock:
+                    del self._inflight[url]
+                result.set_result(game_data)
+
+        except requests.RequestException as e:
+            self.logger.error("Request failed for URL %s: %s", url, e)
+            return None
+        except Exception as e:
+            self.logger.error("Error fetching game data from %s: %s", url, e)
+            return None
+
+    def _load_game_data(self, url: str) -> Optional[Dict[str, Any]]:
+        """Load game data from the disk cache, or fetch it from the web on a miss."""
+        cached_data = self._get_cached_data(url)
+        if cached_data is not None:
+            self._count_cache_stat("hits")
+            if self.logger.isEnabledFor(logging.INFO):
                 match_id = cached_data.get("matchInfo", {}).get("id", "unknown")
-                self.logger.info(f"Using cached game data for match: {match_id}")
-                return cached_data
+                self.logger.info("Using cached game data for match: %s", match_id)
+            self._remember(url, cached_data)
+            return cached_data
 
-            # Cache miss - fetch from web
-            self.logger.info(f"Fetching game data from: {url}")
-            self.cache_stats["misses"] += 1
+        # Cache miss - fetch from web
+        self.logger.info("Fetching game data from: %s", url)
+        self._count_cache_stat("misses")
 
-            # Fetch the page
-            response = self.session.get(url, timeout=self.timeout)
+        # Fetch the page, streaming only as far as the data-page attribute
+        with self.session.get(url, timeout=self.timeout, stream=True) as response:
             response.raise_for_status()
+            page_bytes = self._read_until_data_page(response)
 
-            # Extract JSON data from the page
-            game_data = self._extract_game_data_from_html(response.text)
+        # Extract JSON data from the page
+        game_data = self._extract_game_data_from_html(page_bytes)
 
-            if game_data:
+        if game_data:
+            if self.logger.isEnabledFor(logging.INFO):
                 match_id = game_data.get("matchInfo", {}).get("id", "unknown")
                 self.logger.info(
-                    f"Successfully fetched game data for match: {match_id}"
+                    "Successfully fetched game data for match: %s", match_id
                 )
 
-                # Cache the successful response
-                self._cache_data(url, game_data)
-                self.cache_stats["new_fetches"] += 1
+            # Cache the successful response
+            self._cache_data(url, game_data)
+            self._remember(url, game_data)
+            self._count_cache_stat("new_fetches")
 
-                return game_data
-            else:
-                self.logger.warning(f"No game data found in URL: {url}")
-                return None
-
-        except requests.RequestException as e:
-            self.logger.error(f"Request failed for URL {url}: {e}")
-            return None
-        except Exception as e:
-            self.logger.error(f"Error fetching game data from {url}: {e}")
+            return game_data
+        else:
+            self.logger.warning("No game data found in URL: %s", url)
             return None
 
+    def _recall(self, url: str) -> Optional[Dict[str, Any]]:
+        """Get game data from the in-memory LRU, marking it most recently used."""
+        with self._memory_lock:
+            game_data = self._memory_cache.get(url)
+            if game_data is not None:
+                self._memory_cache.move_to_end(url)
+            return game_data
+
+    def _remember(self, url: str, game_data: Dict[str, Any]) -> None:
+        """Add game data to the in-memory LRU, evicting the oldest entry if full."""
+        with self._memory_lock:
+            self._memory_cache[url] = game_data
+            self._memory_cache.move_to_end(url)
+            if len(self._memory_cache) > self._memory_cache_max:
+                self._memory_cache.popitem(last=False)
+
+    def fetch_many(
+        self, urls: List[str], max_workers: int = 16
+    ) -> Dict[str, Optional[Dict[str, Any]]]:
+        """
+        Fetch game data for many DartConnect recap URLs concurrently.
+
+        Cache misses are bound by network round trips, so the URLs are fetched
+        with fetch_game_data() on a thread pool sharing this fetcher's
+        session and connection pool.
+
+        Args:
+            urls: DartConnect recap URLs (duplicates are fetched once)
+            max_workers: Maximum number of concurrent fetches
+
+        Returns:
+            Dictionary mapping each URL to its game data, or None if the fetch failed
+        """
+        unique_urls = list(dict.fromkeys(urls))
+        # More workers than pooled connections would just open and discard
+        # extra sockets
+        max_workers = min(max_workers, _MAX_CONCURRENT_FETCHES)
+        if len(unique_urls) <= 1:
+            return {url: self.fetch_game_data(url) for url in unique_urls}
+
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            results = executor.map(self.fetch_game_data, unique_urls)
+            return dict(zip(unique_urls, results))
+
     def _is_valid_dartconnect_url(self, url: str) -> bool:
         """Validate if URL is a proper DartConnect recap URL."""
-        try:
-            parsed = urlparse(url)
-            return parsed.netloc == "recap.dartconnect.com" and (
-                (parsed.path.startswith("/games/") and len(parsed.path.split("/")) >= 3)
-                or (
-                    parsed.path.startswith("/history/report/match/")
-                    and len(parsed.path.split("/")) >= 5
-                )
-            )
-        except Exception:
-            return False
+        return isinstance(url, str) and _is_recap_url(url)
 
     def _get_cache_filename(self, url: str) -> str:
         """Generate a unique cache filename for a URL."""
-        # Extract match ID from URL for readable filenames
-        match_id = None
-        if "/games/" in url:
-            match_id = url.split("/games/")[-1]
-        elif "/match/" in url:
-            match_id = url.split("/match/")[-1]
-
-        if match_id:
-            # Clean match ID of any query parameters
-            match_id = match_id.split("?")[0].split("#")[0]
-            return f"{match_id}.json"
-        else:
-            # Fallback to URL hash if we can't extract match ID
-            url_hash = hashlib.md5(url.encode()).hexdigest()
-            return f"url_{url_hash}.json"
+        return _cache_filename_for(url)
 
     def _get_cached_data(self, url: str) -> Optional[Dict[str, Any]]:
         """Get cached data for a URL if it exists and is not expired."""
         try:
-            cache_file = self.cache_dir / self._get_cache_filename(url)
-
-            if not cache_file.exists():
-                return None
+            filename = self._get_cache_filename(url)
+            cache_file = self.cache_dir / filename
+            mtime_index = self._get_mtime_index()
+            mtime = mtime_index.get(filename)
+
+            if mtime is None:
+                # Not indexed: confirm with a stat in case another process
+                # wrote it since the scan (a miss costs a fetch anyway)
+                if not cache_file.exists():
+                    return None
+                mtime = mtime_index[filename] = cache_file.stat().st_mtime
 
             # Check if cache is expired
-            file_age = datetime.now() - datetime.fromtimestamp(
-                cache_file.stat().st_mtime
-            )
-            if file_age > timedelta(days=self.cache_expiry_days):
+            file_age = time.time() - mtime
+            if file_age > self._expiry_seconds:
                 self.logger.debug(
-                    f"Cache expired for {url} (age: {file_age.days} days)"
+                    "Cache expired for %s (age: %d days)", url, file_age // 86400
                 )
-                self.cache_stats["expired"] += 1
+                self._count_cache_stat("expired")
                 # Remove expired cache file
-                cache_file.unlink()
+                mtime_index.pop(filename, None)
+                cache_file.unlink(missing_ok=True)
                 return None
 
-            # Load and return cached data
-            with open(cache_file, "r", encoding="utf-8") as f:
-                cached_data = json.load(f)
-                return cached_data.get("game_data")
+            # Load and return cached data (the file holds the game data itself)
+            cached_data = _loads_json(cache_file.read_bytes())
+
+            if "game_data" in cached_data and "segments" not in cached_data:
+                # Legacy {"url", "cached_at", "game_data"} envelope: rewrite it
+                # in the current format, keeping the original mtime for expiry
+                cached_data = cached_data["game_data"]
+                if cached_data is not None:
+                    self._write_cache_file(cache_file, cached_data)
+                    os.utime(cache_file, (mtime, mtime))
+
+            return cached_data
 
         except Exception as e:
-            self.logger.warning(f"Error reading cache for {url}: {e}")
+            self.logger.warning("Error reading cache for %s: %s", url, e)
             return None
 
+    def _get_mtime_index(self) -> Dict[str, float]:
+        """Get the cache filename -> mtime index, scanning the cache dir on first use.
+
+        One os.scandir pass replaces an exists() + stat() per lookup.
+        """
+        if self._mtime_index is None:
+            index = {}
+            with os.scandir(self.cache_dir) as entries:
+                for entry in entries:
+                    if entry.name.endswith(".json") and entry.is_file():
+                        index[entry.name] = entry.stat().st_mtime
+            self._mtime_index = index
+        return self._mtime_index
+
     def _cache_data(self, url: str, game_data: Dict[str, Any]) -> None:
         """Cache game data for a URL."""
         try:
             cache_file = self.cache_dir / self._get_cache_filename(url)
 
-            cache_entry = {
-                "url": url,
-                "cached_at": datetime.now().isoformat(),
-                "game_data": game_data,
-            }
-
-            with open(cache_file, "w", encoding="utf-8") as f:
-                json.dump(cache_entry, f, indent=2, ensure_ascii=False)
+            # Store the game data alone: the filename identifies the match and
+            # the file mtime records when it was cached
+            self._write_cache_file(cache_file, game_data)
+            self._get_mtime_index()[cache_file.name] = time.time()
 
-            self.logger.debug(f"Cached data for {url}")
+            self.logger.debug("Cached data for %s", url)
 
         except Exception as e:
-            self.logger.warning(f"Error caching data for {url}: {e}")
+            self.logger.warning("Error caching data for %s: %s", url, e)
+
+    def _write_cache_file(self, cache_file: Path, game_data: Dict[str, Any]) -> None:
+        """Write a cache file atomically so readers never see a partial file."""
+        tmp_file = cache_file.with_name(f"{cache_file.name}.{os.getpid()}.tmp")
+        try:
+            tmp_file.write_bytes(_dumps_json(game_data))
+            os.replace(tmp_file, cache_file)
+        except BaseException:
+            tmp_file.unlink(missing_ok=True)
+            raise
+
+    def _count_cache_stat(self, stat: str) -> None:
+        """Increment a cache statistic (thread-safe)."""
+        with self._stats_lock:
+            self.cache_stats[stat] += 1
 
     def get_cache_stats(self) -> Dict[str, int]:
         """Get cache performance statistics."""
-        return self.cache_stats.copy()
+        with self._stats_lock:
+            return self.cache_stats.copy()
 
     def get_cache_info(self) -> Dict[str, Any]:
         """Get detailed cache information including size and age statistics."""
@@ -206,8 +597,15 @@ class DartConnectURLFetcher:
                     "newest_file": None,
                 }
 
-            cache_files = list(self.cache_dir.glob("*.json"))
-            if not cache_files:
+            # One scandir pass: DirEntry.stat() is cached per entry
+            entries = []
+            with os.scandir(self.cache_dir) as it:
+                for entry in it:
+                    if entry.name.endswith(".json") and entry.is_file():
+                        st = entry.stat()
+                        entries.append((entry.name, st.st_size, st.st_mtime))
+
+            if not entries:
                 return {
                     "total_files": 0,
                     "total_size_mb": 0,
@@ -215,31 +613,29 @@ class DartConnectURLFetcher:
                     "newest_file": None,
                 }
 
-            total_size = sum(f.stat().st_size for f in cache_files)
-            file_times = [
-                (f, datetime.fromtimestamp(f.stat().st_mtime)) for f in cache_files
-            ]
-
-            oldest_file = min(file_times, key=lambda x: x[1])
-            newest_file = max(file_times, key=lambda x: x[1])
+            total_size = sum(size for _, size, _ in entries)
+            oldest_file = min(entries, key=itemgetter(2))
+            newest_file = max(entries, key=itemgetter(2))
 
+            # Ages as raw timestamps; datetimes are only built for the report
+            now = time.time()
             return {
-                "total_files": len(cache_files),
+                "total_files": len(entries),
                 "total_size_mb": round(total_size / (1024 * 1024), 2),
                 "oldest_file": {
-                    "name": oldest_file[0].name,
-                    "date": oldest_file[1].isoformat(),
-                    "age_days": (datetime.now() - oldest_file[1]).days,
+                    "name": oldest_file[0],
+                    "date": datetime.fromtimestamp(oldest_file[2]).isoformat(),
+                    "age_days": int((now - oldest_file[2]) // 86400),
                 },
                 "newest_file": {
-                    "name": newest_file[0].name,
-                    "date": newest_file[1].isoformat(),
-                    "age_days": (datetime.now() - newest_file[1]).days,
+                    "name": newest_file[0],
+                    "date": datetime.fromtimestamp(newest_file[2]).isoformat(),
+                    "age_days": int((now - newest_file[2]) // 86400),
                 },
                 "expiry_days": self.cache_expiry_days,
             }
         except Exception as e:
-            self.logger.error(f"Error getting cache info: {e}")
+            self.logger.error("Error getting cache info: %s", e)
             return {"error": str(e)}
 
     def clear_cache(self, older_than_days: Optional[int] = None) -> int:
@@ -252,63 +648,116 @@ class DartConnectURLFetcher:
 
             cutoff_time = None
             if older_than_days is not None:
-                cutoff_time = datetime.now() - timedelta(days=older_than_days)
-
-            for cache_file in self.cache_dir.glob("*.json"):
-                try:
-                    if cutoff_time is None:
-                        # Clear all cache files
-                        cache_file.unlink()
-                        cleared_count += 1
-                    else:
-                        # Only clear files older than cutoff
-                        file_time = datetime.fromtimestamp(cache_file.stat().st_mtime)
-                        if file_time < cutoff_time:
-                            cache_file.unlink()
+                cutoff_time = time.time() - older_than_days * 86400
+
+            with os.scandir(self.cache_dir) as it:
+                for entry in it:
+                    if not entry.name.endswith(".json"):
+                        continue
+                    try:
+                        # Clear all cache files, or only those older than cutoff
+                        if cutoff_time is None or entry.stat().st_mtime < cutoff_time:
+                            os.unlink(entry.path)
                             cleared_count += 1
 
-                except Exception as e:
-                    self.logger.warning(f"Error removing cache file {cache_file}: {e}")
+                    except Exception as e:
+                        self.logger.warning(
+                            "Error removing cache file %s: %s", entry.path, e
+                        )
 
             if cleared_count > 0:
-                self.logger.info(f"Cleared {cleared_count} cache files")
+                self.logger.info("Cleared %s cache files", cleared_count)
+                self._mtime_index = None
+                with self._memory_lock:
+                    self._memory_cache.clear()
 
         except Exception as e:
-            self.logger.error(f"Error clearing cache: {e}")
+            self.logger.error("Error clearing cache: %s", e)
 
         return cleared_count
 
+    def _read_until_data_page(self, response: requests.Response) -> bytes:
+        """Read a streamed response body up to the end of the data-page attribute.
+
+        The game JSON sits in one attribute near the top of the page, so
+        everything after it is only drained (not buffered or searched). Draining
+        a modest remainder lets urllib3 return the connection to the pool, since
+        closing a half-read response discards it; a remainder larger than
+        _MAX_DRAIN_BYTES is abandoned instead, trading that connection for the
+        download. If the attribute never appears, the whole body is returned.
+        """
+        buffer = bytearray()
+        start = -1
+        scanned = 0
+        chunks = response.iter_content(chunk_size=65536)
+
+        for chunk in chunks:
+            buffer += chunk
+
+            if start < 0:
+                # Back up so a marker split across chunks is still found
+                start = buffer.find(
+                    _DATA_PAGE_MARKER, max(scanned - len(_DATA_PAGE_MARKER), 0)
+                )
+                scanned = len(buffer)
+                if start < 0:
+                    continue
+                scanned = start + len(_DATA_PAGE_MARKER)
+
+            if buffer.find(b'"', scanned) >= 0:
+                break
+            scanned = len(buffer)
+
+        drained = 0
+        for chunk in chunks:
+            drained += len(chunk)
+            if drained > _MAX_DRAIN_BYTES:
+                break
+
+        return bytes(buffer)
+
     def _extract_game_data_from_html(
-        self, html_content: str
+        self, html_content: bytes
     ) -> Optional[Dict[str, Any]]:
-        """Extract game data from the HTML page's data-page attribute."""
+        """Extract game data from the HTML page's data-page attribute.
+
+        Works on the raw response bytes: the attribute is located with a plain
+        substring search and only the attribute value is decoded.
+        """
         try:
             # Find the data-page attribute
-            pattern = r'data-page="([^"]+)"'
-            match = re.search(pattern, html_content)
+            start = html_content.find(_DATA_PAGE_MARKER)
+            if start < 0:
+                self.logger.warning("Could not find data-page attribute in HTML")
+                return None
 
-            if not match:
+            start += len(_DATA_PAGE_MARKER)
+            end = html_content.find(b'"', start)
+            if end <= start:
                 self.logger.warning("Could not find data-page attribute in HTML")
                 return None
 
             # Decode HTML entities
-            json_data = html.unescape(match.group(1))
+            json_data = _unescape_attribute(html_content[start:end].decode("utf-8"))
 
             # Parse JSON
-            page_data = json.loads(json_data)
+            page_data = _loads_json(json_data)
 
-            # Extract the props which contain the game data
-            if "props" in page_data:
-                return page_data["props"]
+            # Extract the props which contain the game data, keeping only the
+            # parts we use so the memo and cache files don't carry the rest
+            props = page_data.get("props")
+            if props is not None:
+                return {key: props[key] for key in _GAME_DATA_PROPS if key in props}
             else:
                 self.logger.warning("No props found in page data")
                 return None
 
-        except json.JSONDecodeError as e:
-            self.logger.error(f"Failed to parse JSON data: {e}")
+        except ValueError as e:
+            # json.JSONDecodeError and orjson.JSONDecodeError both subclass ValueError
+            self.logger.error("Failed to parse JSON data: %s", e)
             return None
         except Exception as e:
-            self.logger.error(f"Error extracting game data from HTML: {e}")
+            self.logger.error("Error extracting game data from HTML: %s", e)
             return None
 
     def extract_cricket_stats(self, game_data: Dict[str, Any]) -> List[Dict[str, Any]]:
@@ -324,33 +773,91 @@ class DartConnectURLFetcher:
         cricket_games = []
 
         try:
-            segments = game_data.get("segments", {})
-
-            # Process each segment (usually just one empty key)
-            for segment_key, segment_games in segments.items():
-                if not isinstance(segment_games, list):
-                    continue
-
-                # Process each game group
-                for game_group in segment_games:
-                    if not isinstance(game_group, list):
-                        continue
-
-                    # Process each individual game
-                    for game in game_group:
-                        if game.get("game_name") == "Cricket":
-                            cricket_stats = self._parse_cricket_game(game)
-                            if cricket_stats:
-                                cricket_games.append(cricket_stats)
+            for game in self._select_games(game_data, "Cricket"):
+                cricket_stats = self._parse_cricket_game(game)
+                if cricket_stats:
+                    cricket_games.append(cricket_stats)
 
             return cricket_games
 
         except Exception as e:
-            self.logger.error(f"Error extracting cricket stats: {e}")
+            self.logger.error("Error extracting cricket stats: %s", e)
             return []
 
-    def _parse_cricket_game(self, game: Dict[str, Any]) -> Optional[Dict[str, Any]]:
-        """Parse individual Cricket game for detailed statistics and QP calculation."""
+    def extract_cricket_stats_batch(
+        self, game_data_list: List[Dict[str, Any]], max_workers: Optional[int] = None
+    ) -> List[Dict[str, Any]]:
+        """
+        Extract Cricket statistics from many matches at once.
+
+        Equivalent to calling extract_cricket_stats() on each match and
+        concatenating the results. Large sets of games are parsed across a
+        process pool, since parsing is pure-Python CPU work.
+
+        Args:
+            game_data_list: Game data dictionaries from fetch_game_data()
+            max_workers: Process pool size (default: number of CPUs)
+
+        Returns:
+            List of cricket game statistics with enhanced metrics
+        """
+        games = []
+        for game_data in game_data_list:
+            try:
+                games.extend(self._select_games(game_data, "Cricket"))
+            except Exception as e:
+                self.logger.error("Error extracting cricket stats: %s", e)
+
+        parsed_games = None
+        if len(games) >= _PARALLEL_PARSE_MIN_GAMES:
+            try:
+                with ProcessPoolExecutor(max_workers=max_workers) as executor:
+                    parsed_games = list(
+                        executor.map(self._parse_cricket_game, games, chunksize=16)
+                    )
+            except Exception as e:
+                self.logger.warning(
+                    "Parallel cricket parsing failed, parsing serially: %s", e
+                )
+
+        if parsed_games is None:
+            parsed_games = [self._parse_cricket_game(game) for game in games]
+
+        return [game for game in parsed_games if game]
+
+    def _select_games(
+        self, game_data: Dict[str, Any], game_name: str
+    ) -> List[Dict[str, Any]]:
+        """Return the raw games named game_name from a match's segments.
+
+        Segments (usually just one empty key) hold lists of game groups, each
+        a list of games; these are flattened and filtered in one pass before
+        any per-game parsing.
+        """
+        game_groups = chain.from_iterable(
+            segment_games
+            for segment_games in game_data.get("segments", {}).values()
+            if isinstance(segment_games, list)
+        )
+        games = chain.from_iterable(
+            game_group for game_group in game_groups if isinstance(game_group, list)
+        )
+        return [
+            game
+            for game in games
+            if isinstance(game, dict) and game.get("game_name") == game_name
+        ]
+
+    @staticmethod
+    def _parse_cricket_game(game: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        """Parse individual Cricket game for detailed statistics and QP calculation.
+
+        A staticmethod so it can be pickled into worker processes by
+        extract_cricket_stats_batch().
+        """
+        parse_turn = DartConnectURLFetcher._parse_cricket_turn
+        calculate_turn_qp = DartConnectURLFetcher._calculate_turn_qp
+
         try:
             turns = game.get("turns", [])
             if not turns:
@@ -358,64 +865,70 @@ class DartConnectURLFetcher:
 
             # Initialize player stats with turn-by-turn tracking
             players = {}
+            # Raw DartConnect name -> stats, so each name is normalized once
+            # per game rather than on every turn
+            players_by_raw_name = {}
 
             # Process each turn to track marks and bulls PER TURN for QP calculation
             for turn in turns:
-                home_player = turn.get("home", {})
-                away_player = turn.get("away", {})
-
-                for player_data in [home_player, away_player]:
+                for player_data in (turn.get("home"), turn.get("away")):
                     if not player_data:
                         continue
 
-                    name = player_data.get("name")
-                    if not name:
+                    raw_name = player_data.get("name")
+                    if not raw_name:
                         continue
 
-                    # Normalize whitespace (DartConnect sometimes has
-                    # trailing spaces in first names, e.g. "Lee  Kimbel")
-                    name = " ".join(name.split())
+                    player = players_by_raw_name.get(raw_name)
+                    if player is None:
+                        # Normalize whitespace (DartConnect sometimes has
+                        # trailing spaces in first names, e.g. "Lee  Kimbel")
+                        name = " ".join(raw_name.split())
 
-                    # Initialize player if not seen before
-                    if name not in players:
-                        players[name] = {
-                            "name": name,
-                            "turn_data": [],  # Store each turn's marks and bulls
-                            "total_qp": 0,  # Sum of QPs from all qualifying turns
-                        }
+                        # Initialize player if not seen before
+                        player = players.get(name)
+                        if player is None:
+                            player = players[name] = _CricketPlayerStats(name)
+                        players_by_raw_name[raw_name] = player
 
                     # Parse this turn's score to get marks and bulls
                     turn_score = player_data.get("turn_score", "")
-                    marks, bulls = self._parse_cricket_turn(turn_score)
+                    marks, bulls = parse_turn(turn_score)
 
-                    # Store turn data
-                    players[name]["turn_data"].append({"marks": marks, "bulls": bulls})
+                    # Count achievement turns rather than keeping every turn
+                    if bulls >= 6:
+                        player.six_bull_turns += 1
+                    if marks >= 9:
+                        player.nine_mark_turns += 1
 
                     # Calculate QP for this turn
-                    turn_qp = self._calculate_turn_qp(marks, bulls)
+                    turn_qp = calculate_turn_qp(marks, bulls)
 
                     # Accumulate QPs from all qualifying turns
-                    players[name]["total_qp"] += turn_qp
+                    player.total_qp += turn_qp
 
             # Add game-level information
+            home = game.get("home") or {}
+            away = game.get("away") or {}
             game_info = {
                 "game_name": "Cricket",
                 "winner_index": game.get("winner_index"),
                 "duration": game.get("duration"),
-                "home_mpr": game.get("home", {}).get("mpr"),
-                "away_mpr": game.get("away", {}).get("mpr"),
-                "home_ending_marks": game.get("home", {}).get("ending_marks", 0),
-                "away_ending_marks": game.get("away", {}).get("ending_marks", 0),
-                "players": list(players.values()),
+                "home_mpr": home.get("mpr"),
+                "away_mpr": away.get("mpr"),
+                "home_ending_marks": home.get("ending_marks", 0),
+                "away_ending_marks": away.get("ending_marks", 0),
+                "players": [player.to_dict() for player in players.values()],
             }
 
             return game_info
 
         except Exception as e:
-            self.logger.error(f"Error parsing cricket game: {e}")
+            logger.error("Error parsing cricket game: %s", e)
             return None
 
-    def _parse_cricket_turn(self, turn_score: str) -> tuple:
+    @staticmethod
+    def _parse_cricket_turn(turn_score: str) -> tuple:
         """Parse a cricket turn score to count marks and bulls.
 
         Args:
@@ -435,95 +948,37 @@ class DartConnectURLFetcher:
         bulls = 0
 
         # Split by comma and process each dart
-        darts = [d.strip() for d in turn_score.split(",")]
+        for dart in turn_score.split(","):
+            dart = dart.strip()
 
-        for dart in darts:
             # Determine xN multiplier (e.g., "SBx2" → 2, "T20x3" → 3)
-            multiplier = 1
-            if "x" in dart:
-                try:
-                    multiplier = int(dart.split("x")[1])
-                except (ValueError, IndexError):
-                    pass
-
-            # Count bulls: SB (single bull=1 mark), DB (double bull=2 marks),
-            # or bare B (single bull=1 mark)
-            if dart.startswith("SB"):
-                bulls += 1 * multiplier
-            elif dart.startswith("DB"):
-                bulls += 2 * multiplier
-            elif dart.startswith("B"):
-                # Bare "B" without S/D prefix — treat as single bull
-                bulls += 1 * multiplier
-            # Count marks on cricket numbers (15-20)
-            elif any(num in dart for num in ["15", "16", "17", "18", "19", "20"]):
-                if dart.startswith("T"):
-                    marks += 3 * multiplier
-                elif dart.startswith("D"):
-                    marks += 2 * multiplier
-                elif dart.startswith("S"):
-                    marks += 1 * multiplier
+            _, sep, count = dart.rpartition("x")
+            multiplier = int(count) if sep and count.strip().isdecimal() else 1
+
+            # Look up the dart's (marks, bulls) value by its leading
+            # segment code: T/D/S + 15-20, SB/DB, or a bare B
+            value = (
+                _DART_VALUES.get(dart[:3])
+                or _DART_VALUES.get(dart[:2])
+                or _DART_VALUES.get(dart[:1])
+            )
+            if value:
+                marks += value[0] * multiplier
+                bulls += value[1] * multiplier
 
         return (marks, bulls)
 
-    def _calculate_turn_qp(self, marks: int, bulls: int) -> int:
+    @staticmethod
+    def _calculate_turn_qp(marks: int, bulls: int) -> int:
         """Calculate QP for a single turn based on marks and bulls.
 
-        QP Rules:
-        5 QP: 9H, 6B, 3H+4B, 6H+2B
-        4 QP: 8H, 5B, 2H+4B, 3H+3B, 5H+2B, 6H+1B
-        3 QP: 7H, 4B, 1H+4B, 2H+3B, 4H+2B, 5H+1B
-        2 QP: 6H, 3B, 1H+3B, 3H+2B, 4H+1B
-        1 QP: 5H, 3H+1B, 2H+2B
+        Looks the turn up in _CRICKET_QP_TABLE (see _cricket_turn_qp for the
+        rules). Counts above the table bounds score the same as the bound.
         """
-        # QP Level 5
-        if (
-            marks >= 9
-            or bulls >= 6
-            or (marks >= 3 and bulls >= 4)
-            or (marks >= 6 and bulls >= 2)
-        ):
-            return 5
-
-        # QP Level 4
-        elif (
-            marks >= 8
-            or bulls >= 5
-            or (marks >= 2 and bulls >= 4)
-            or (marks >= 3 and bulls >= 3)
-            or (marks >= 5 and bulls >= 2)
-            or (marks >= 6 and bulls >= 1)
-        ):
-            return 4
-
-        # QP Level 3
-        elif (
-            marks >= 7
-            or bulls >= 4
-            or (marks >= 1 and bulls >= 4)
-            or (marks >= 2 and bulls >= 3)
-            or (marks >= 4 and bulls >= 2)
-            or (marks >= 5 and bulls >= 1)
-        ):
-            return 3
-
-        # QP Level 2
-        elif (
-            marks >= 6
-            or bulls >= 3
-            or (marks >= 1 and bulls >= 3)
-            or (marks >= 3 and bulls >= 2)
-            or (marks >= 4 and bulls >= 1)
-        ):
-            return 2
-
-        # QP Level 1
-        elif marks >= 5 or (marks >= 3 and bulls >= 1) or (marks >= 2 and bulls >= 2):
-            return 1
-
-        # No QP
-        else:
-            return 0
+        return _CRICKET_QP_TABLE[
+            min(max(marks, 0), _MAX_QP_MARKS) * (_MAX_QP_BULLS + 1)
+            + min(max(bulls, 0), _MAX_QP_BULLS)
+        ]
 
     def calculate_cricket_qp(self, player_stats: Dict[str, Any]) -> int:
         """
@@ -553,26 +1008,15 @@ class DartConnectURLFetcher:
         games_501 = []
 
         try:
-            segments = game_data.get("segments", {})
-
-            for segment_key, segment_games in segments.items():
-                if not isinstance(segment_games, list):
-                    continue
-
-                for game_group in segment_games:
-                    if not isinstance(game_group, list):
-                        continue
-
-                    for game in game_group:
-                        if game.get("game_name") == "501 SIDO":
-                            stats = self._parse_501_game(game)
-                            if stats:
-                                games_501.append(stats)
+            for game in self._select_games(game_data, "501 SIDO"):
+                stats = self._parse_501_game(game)
+                if stats:
+                    games_501.append(stats)
 
             return games_501
 
         except Exception as e:
-            self.logger.error(f"Error extracting 501 stats: {e}")
+            self.logger.error("Error extracting 501 stats: %s", e)
             return []
 
     def _parse_501_game(self, game: Dict[str, Any]) -> Optional[Dict[str, Any]]:
@@ -621,7 +1065,7 @@ class DartConnectURLFetcher:
             }
 
         except Exception as e:
-            self.logger.error(f"Error parsing 501 game: {e}")
+            self.logger.error("Error parsing 501 game: %s", e)
             return None
 
     def _calculate_501_turn_qp(self, turn_score: int) -> int:
@@ -634,17 +1078,15 @@ class DartConnectURLFetcher:
         4: 148-163
         5: 164-180
         """
-        if 164 <= turn_score <= 180:
-            return 5
-        elif 148 <= turn_score <= 163:
-            return 4
-        elif 132 <= turn_score <= 147:
-            return 3
-        elif 116 <= turn_score <= 131:
-            return 2
-        elif 95 <= turn_score <= 115:
-            return 1
-        return 0
+        if not 0 <= turn_score <= 180:
+            return 0
+        index = int(turn_score)
+        qp = _501_TURN_QP[index]
+        # Non-integer scores (e.g. floats from parsed data) match the band
+        # comparisons: a fractional score only counts strictly inside a band
+        if index != turn_score and _501_TURN_QP[index + 1] != qp:
+            return 0
+        return qp
 
     def calculate_501_qp(
         self, total_score: int, checkout_score: Optional[int] = None
@@ -671,35 +1113,15 @@ class DartConnectURLFetcher:
             Total QPs earned (sum of both columns)
         """
         try:
-            total_qps = 0
-
             # QPs from total score column
-            if 164 <= total_score <= 180:
-                total_qps += 5
-            elif 148 <= total_score <= 163:
-                total_qps += 4
-            elif 132 <= total_score <= 147:
-                total_qps += 3
-            elif 116 <= total_score <= 131:
-                total_qps += 2
-            elif 95 <= total_score <= 115:
-                total_qps += 1
+            total_qps = _501_band_qp(_501_TOTAL_BOUNDS, total_score)
 
             # QPs from checkout score column (if available)
             if checkout_score is not None:
-                if 151 <= checkout_score <= 170:
-                    total_qps += 5
-                elif 129 <= checkout_score <= 150:
-                    total_qps += 4
-                elif 107 <= checkout_score <= 128:
-                    total_qps += 3
-                elif 85 <= checkout_score <= 106:
-                    total_qps += 2
-                elif 61 <= checkout_score <= 84:
-                    total_qps += 1
+                total_qps += _501_band_qp(_501_CHECKOUT_BOUNDS, checkout_score)
 
             return total_qps
 
         except Exception as e:
-            self.logger.error(f"Error calculating 501 QP: {e}")
+            self.logger.error("Error calculating 501 QP: %s", e)
             return 0
@@ -24,11 +24,23 @@ Advantages over Selenium:
 """
 
 import os
+import json
 import logging
 import time
+import threading
 import requests
+from concurrent.futures import ThreadPoolExecutor
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple, Union
+
+try:
+    import orjson
+
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
 
 
 class WixAPIUploader:
@@ -36,6 +48,25 @@ class WixAPIUploader:
 
     BASE_URL = "https://www.wixapis.com"
 
+    # Connection pool sizing; a weekly run uploads 4 PDFs
+    POOL_CONNECTIONS = 4
+    POOL_MAXSIZE = 8
+
+    # Concurrent uploads per batch, kept low to stay within Wix API quotas
+    MAX_UPLOAD_WORKERS = 4
+
+    # Backoff delays (seconds) between checks that an upload finished processing
+    READY_POLL_DELAYS = (0.1, 0.2, 0.4, 0.8, 1.6)
+
+    # Uploads up to this size are read into memory once and reused on retry
+    MAX_BUFFERED_UPLOAD_BYTES = 32 * 1024 * 1024
+
+    # A repeat publish within this window with no changes since is skipped
+    PUBLISH_DEDUP_SECONDS = 60
+
+    # Resolved folder IDs persisted across runs, per site, keyed by path
+    FOLDER_ID_CACHE_PATH = Path.home() / ".cache" / "dartconnect" / "wix_folders.json"
+
     def __init__(self, api_key: Optional[str] = None, site_id: Optional[str] = None):
         """
         Initialize Wix API uploader.
@@ -60,17 +91,112 @@ class WixAPIUploader:
                 "Find it in your dashboard URL after '/dashboard/'"
             )
 
-        self.session = requests.Session()
-        self.session.headers.update(
-            {
-                "Authorization": self.api_key,
-                "wix-site-id": self.site_id,
-                "Content-Type": "application/json",
-            }
-        )
+        # HTTP sessions are created on first use, so callers that only touch
+        # cached data never build a session or TLS context
+        self._session: Optional[requests.Session] = None
+        self._upload_session: Optional[requests.Session] = None
+        self._session_lock = threading.Lock()
+
+        # Folder/file listings for this run, keyed by parent folder ID
+        self._folder_cache: Dict[str, List[Dict]] = {}
+        self._file_cache: Dict[str, List[Dict]] = {}
+        # displayName -> folder lookup over each cached folder listing
+        self._folder_index: Dict[str, Dict[str, Dict]] = {}
+
+        # Folder IDs are stable for a season, so reuse them from earlier runs
+        self._folder_id_cache_path = self.FOLDER_ID_CACHE_PATH
+        self._folder_ids = self._load_folder_ids()
+
+        # Publish bookkeeping: when the last publish happened, and whether
+        # anything was uploaded/changed since then
+        self._last_publish: Optional[float] = None
+        self._changed_since_publish = False
 
         self.logger.info("✅ Wix API uploader initialized")
 
+    @property
+    def session(self) -> requests.Session:
+        """Authenticated Wix API session, created on first use."""
+        if self._session is None:
+            with self._session_lock:
+                if self._session is None:
+                    # Retry Wix rate limits (429) and transient 5xx with
+                    # jittered exponential backoff, honouring Retry-After.
+                    # Only GETs are retried: a POST that timed out may have
+                    # already created a folder or upload URL on the Wix side
+                    retry_strategy = Retry(
+                        total=3,
+                        backoff_factor=1.0,
+                        backoff_jitter=0.5,
+                        status_forcelist=[429, 500, 502, 503, 504],
+                        allowed_methods=["GET"],
+                        respect_retry_after_header=True,
+                        raise_on_status=False,
+                    )
+                    session = self._new_session(retry_strategy)
+                    session.headers.update(
+                        {
+                            "Authorization": self.api_key,
+                            "wix-site-id": self.site_id,
+                            "Content-Type": "application/json",
+                        }
+                    )
+                    self._session = session
+        return self._session
+
+    @property
+    def upload_session(self) -> requests.Session:
+        """Session for file bytes, created on first use.
+
+        File bytes go to a pre-signed upload host that must not receive the
+        API auth headers, so uploads get their own pooled session. Upload
+        bodies are file streams that cannot be replayed, so it never retries.
+        """
+        if self._upload_session is None:
+            with self._session_lock:
+                if self._upload_session is None:
+                    self._upload_session = self._new_session(0)
+        return self._upload_session
+
+    def _new_session(self, retries) -> requests.Session:
+        """Create a session with a pooled adapter using the given retry policy."""
+        session = requests.Session()
+        adapter = HTTPAdapter(
+            pool_connections=self.POOL_CONNECTIONS,
+            pool_maxsize=self.POOL_MAXSIZE,
+            max_retries=retries,
+        )
+        session.mount("https://", adapter)
+        session.mount("http://", adapter)
+        return session
+
+    def close(self) -> None:
+        """Close the pooled HTTP sessions (if they were ever opened)."""
+        for session in (self._session, self._upload_session):
+            if session is not None:
+                session.close()
+        self._session = self._upload_session = None
+
+    def clear_cache(self) -> None:
+        """Drop cached folder and file listings so the next lookup refetches."""
+        self._folder_cache.clear()
+        self._file_cache.clear()
+        self._folder_index.clear()
+
+    @staticmethod
+    def _folder_key(parent_folder_id: Optional[str]) -> str:
+        """Listing cache key for a parent folder (None and media-root are the root)."""
+        if parent_folder_id and parent_folder_id != "media-root":
+            return parent_folder_id
+        return "root"
+
+    @staticmethod
+    def _json(response: requests.Response) -> Any:
+        """Parse a response body as JSON, using orjson when it is installed."""
+        if ORJSON_AVAILABLE:
+            return orjson.loads(response.content)
+        return response.json()
+
     def _make_request(self, method: str, endpoint: str, **kwargs) -> requests.Response:
         """
         Make authenticated API request.
@@ -108,6 +234,10 @@ class WixAPIUploader:
         Returns:
             List of folder objects
         """
+        key = self._folder_key(parent_folder_id)
+        if key in self._folder_cache:
+            return list(self._folder_cache[key])
+
         self.logger.debug(f"Listing folders in {parent_folder_id or 'root'}")
 
         # Build query parameters
@@ -117,10 +247,14 @@ class WixAPIUploader:
 
         response = self._make_request("GET", "/site-media/v1/folders", params=params)
 
-        result = response.json()
+        result = self._json(response)
         folders = result.get("folders", [])
         self.logger.debug(f"Found {len(folders)} folder(s)")
-        return folders
+        self._folder_cache[key] = folders
+        index = self._folder_index[key] = {}
+        for folder in folders:
+            index.setdefault(folder.get("displayName"), folder)
+        return list(folders)
 
     def get_folder_by_name(
         self, folder_name: str, parent_folder_id: Optional[str] = None
@@ -135,13 +269,11 @@ class WixAPIUploader:
         Returns:
             Folder object if found, None otherwise
         """
-        folders = self.list_folders(parent_folder_id)
-
-        for folder in folders:
-            if folder.get("displayName") == folder_name:
-                return folder
+        key = self._folder_key(parent_folder_id)
+        if key not in self._folder_index:
+            self.list_folders(parent_folder_id)
 
-        return None
+        return self._folder_index[key].get(folder_name)
 
     def create_folder(
         self, folder_name: str, parent_folder_id: str = "media-root"
@@ -165,9 +297,15 @@ class WixAPIUploader:
 
         response = self._make_request("POST", "/site-media/v1/folders", json=payload)
 
-        folder = response.json().get("folder", {})
+        folder = self._json(response).get("folder", {})
         folder_id = folder.get("id")
 
+        # Keep the cached parent listing in step with the new folder
+        key = self._folder_key(parent_folder_id)
+        if key in self._folder_cache:
+            self._folder_cache[key].append(folder)
+            self._folder_index[key].setdefault(folder_name, folder)
+
         self.logger.info(f"✅ Created folder: {folder_name} (ID: {folder_id})")
         return folder
 
@@ -181,9 +319,22 @@ class WixAPIUploader:
         Returns:
             ID of the deepest folder
         """
-        parent_id = "media-root"
+        path_key = "/".join(folder_path)
+        if path_key in self._folder_ids:
+            self.logger.debug(f"Using cached folder ID for: {path_key}")
+            return self._folder_ids[path_key]
 
-        for folder_name in folder_path:
+        # Resume the walk below the deepest already-resolved parent
+        parent_id = "media-root"
+        start = 0
+        for depth in range(len(folder_path) - 1, 0, -1):
+            cached_id = self._folder_ids.get("/".join(folder_path[:depth]))
+            if cached_id:
+                parent_id, start = cached_id, depth
+                break
+
+        for depth in range(start, len(folder_path)):
+            folder_name = folder_path[depth]
             # Check if folder exists
             folder = self.get_folder_by_name(folder_name, parent_id)
 
@@ -195,8 +346,55 @@ class WixAPIUploader:
                 folder = self.create_folder(folder_name, parent_id)
                 parent_id = folder["id"]
 
+            self._folder_ids["/".join(folder_path[: depth + 1])] = parent_id
+
+        self._save_folder_ids()
         return parent_id
 
+    def _load_folder_ids(self) -> Dict[str, str]:
+        """Load this site's persisted folder IDs (empty if none or unreadable)."""
+        try:
+            with open(self._folder_id_cache_path, "r", encoding="utf-8") as f:
+                return dict(json.load(f).get(self.site_id, {}))
+        except (OSError, ValueError, AttributeError):
+            return {}
+
+    def _save_folder_ids(self) -> None:
+        """Persist this site's folder IDs, keeping entries for other sites."""
+        try:
+            try:
+                with open(self._folder_id_cache_path, "r", encoding="utf-8") as f:
+                    data = json.load(f)
+                if not isinstance(data, dict):
+                    data = {}
+            except (OSError, ValueError):
+                data = {}
+
+            data[self.site_id] = self._folder_ids
+            self._folder_id_cache_path.parent.mkdir(parents=True, exist_ok=True)
+            with open(self._folder_id_cache_path, "w", encoding="utf-8") as f:
+                json.dump(data, f, indent=2)
+        except OSError as e:
+            self.logger.debug(f"Could not save folder ID cache: {e}")
+
+    def forget_folder_ids(self, root_folder: Optional[str] = None) -> None:
+        """
+        Drop persisted folder IDs so they are resolved again from the API.
+
+        Args:
+            root_folder: Only forget paths under this top-level folder (None = all)
+        """
+        if root_folder is None:
+            self._folder_ids.clear()
+        else:
+            prefix = f"{root_folder}/"
+            self._folder_ids = {
+                path: folder_id
+                for path, folder_id in self._folder_ids.items()
+                if path != root_folder and not path.startswith(prefix)
+            }
+        self._save_folder_ids()
+
     def list_files(self, parent_folder_id: str) -> List[Dict]:
         """
         List files in a folder.
@@ -207,6 +405,10 @@ class WixAPIUploader:
         Returns:
             List of file objects
         """
+        key = self._folder_key(parent_folder_id)
+        if key in self._file_cache:
+            return list(self._file_cache[key])
+
         self.logger.debug(f"Listing files in folder {parent_folder_id}")
 
         params = {}
@@ -215,10 +417,11 @@ class WixAPIUploader:
 
         response = self._make_request("GET", "/site-media/v1/files", params=params)
 
-        result = response.json()
+        result = self._json(response)
         files = result.get("files", [])
         self.logger.debug(f"Found {len(files)} file(s)")
-        return files
+        self._file_cache[key] = files
+        return list(files)
 
     def delete_files(self, file_ids: List[str], permanent: bool = False) -> bool:
         """
@@ -243,6 +446,13 @@ class WixAPIUploader:
 
             self._make_request("POST", "/site-media/v1/bulk/files/delete", json=payload)
             self.logger.debug(f"✅ Deleted {len(file_ids)} file(s)")
+            self._changed_since_publish = True
+
+            # Drop deleted files from any cached listings (in place, over a
+            # snapshot, since uploads may invalidate entries concurrently)
+            deleted = set(file_ids)
+            for files in list(self._file_cache.values()):
+                files[:] = [f for f in files if f.get("id") not in deleted]
             return True
         except Exception as e:
             self.logger.error(f"❌ Failed to delete files: {e}")
@@ -262,22 +472,54 @@ class WixAPIUploader:
         Returns:
             Number of files deleted
         """
-        files = self.list_files(folder_id)
-        file_ids_to_delete = []
+        return self.delete_files_by_names(folder_id, [filename], permanent)
 
-        for file in files:
-            if file.get("displayName") == filename:
-                file_ids_to_delete.append(file.get("id"))
+    def delete_files_by_names(
+        self, folder_id: str, filenames: List[str], permanent: bool = False
+    ) -> int:
+        """
+        Delete all files matching any of several names in a folder.
+
+        Lists the folder once and removes every match in a single bulk delete.
+
+        Args:
+            folder_id: Folder to search in
+            filenames: Display names to match
+            permanent: If True, permanently delete. Default: move to trash.
+
+        Returns:
+            Number of files deleted
+        """
+        file_ids_to_delete = self.find_file_ids_by_names(folder_id, filenames)
 
         if file_ids_to_delete:
             if self.delete_files(file_ids_to_delete, permanent):
                 self.logger.info(
-                    f"🗑️  Deleted {len(file_ids_to_delete)} existing file(s) named '{filename}'"
+                    f"🗑️  Deleted {len(file_ids_to_delete)} existing file(s) named "
+                    f"{', '.join(repr(name) for name in filenames)}"
                 )
                 return len(file_ids_to_delete)
 
         return 0
 
+    def find_file_ids_by_names(self, folder_id: str, filenames: List[str]) -> List[str]:
+        """
+        Find IDs of files matching any of several names in a folder.
+
+        Args:
+            folder_id: Folder to search in
+            filenames: Display names to match
+
+        Returns:
+            List of matching file IDs
+        """
+        names = set(filenames)
+        return [
+            file.get("id")
+            for file in self.list_files(folder_id)
+            if file.get("displayName") in names
+        ]
+
     def generate_upload_url(
         self, filename: str, parent_folder_id: str, mime_type: str = "application/pdf"
     ) -> Dict:
@@ -290,7 +532,7 @@ class WixAPIUploader:
             mime_type: MIME type of file
 
         Returns:
-            Dict with uploadUrl and fileId
+            Dict with uploadUrl
         """
         self.logger.debug(f"Generating upload URL for: {filename}")
 
@@ -303,7 +545,7 @@ class WixAPIUploader:
             "POST", "/site-media/v1/files/generate-upload-url", json=payload
         )
 
-        result = response.json()
+        result = self._json(response)
         upload_url = result.get("uploadUrl")
 
         self.logger.debug(f"Got upload URL for {filename}")
@@ -311,7 +553,7 @@ class WixAPIUploader:
 
     def upload_file_to_url(
         self, file_path: Path, upload_url: str, display_name: str
-    ) -> bool:
+    ) -> Union[requests.Response, bool]:
         """
         Upload file bytes to generated upload URL.
 
@@ -321,31 +563,41 @@ class WixAPIUploader:
             display_name: Filename to use in upload (e.g., "Individual.pdf")
 
         Returns:
-            True if successful
+            The upload response if successful (truthy), else False
         """
         self.logger.info(f"Uploading {file_path.name} as {display_name}...")
 
         try:
-            # Try multipart form upload (common for file uploads)
-            # Use display_name instead of file_path.name
+            # Open the file once: typical PDFs are read into memory a single
+            # time and the bytes reused for the fallback; larger files stream
+            # from disk and are rewound instead of reopened
+            size = file_path.stat().st_size
             with open(file_path, "rb") as f:
-                files = {"file": (display_name, f, "application/pdf")}
-                response = requests.post(upload_url, files=files)
-
-            # If that fails, try direct PUT
-            if response.status_code >= 400:
-                self.logger.debug("Multipart failed, trying direct PUT...")
-                with open(file_path, "rb") as f:
-                    response = requests.put(
-                        upload_url,
-                        data=f,
-                        headers={"Content-Type": "application/octet-stream"},
-                    )
+                body = f.read() if size <= self.MAX_BUFFERED_UPLOAD_BYTES else f
+
+                # Try direct PUT first (no multipart payload to assemble)
+                response = self.upload_session.put(
+                    upload_url,
+                    data=body,
+                    headers={
+                        "Content-Type": "application/pdf",
+                        "Content-Length": str(size),
+                    },
+                )
+
+                # If that fails, try multipart form upload
+                # Use display_name instead of file_path.name
+                if response.status_code >= 400:
+                    self.logger.debug("Direct PUT failed, trying multipart...")
+                    if body is f:
+                        f.seek(0)
+                    files = {"file": (display_name, body, "application/pdf")}
+                    response = self.upload_session.post(upload_url, files=files)
 
             response.raise_for_status()
 
             self.logger.info(f"✅ Uploaded {file_path.name}")
-            return True
+            return response
 
         except Exception as e:
             self.logger.error(f"❌ Upload failed for {file_path.name}: {e}")
@@ -372,9 +624,31 @@ class WixAPIUploader:
             True if successful, False otherwise
         """
         display_name = display_name or file_path.name
+        return self._do_upload(
+            *self._prepare_upload(file_path, folder_id, display_name)
+        )
 
-        # Generate upload URL
+    def _prepare_upload(
+        self, file_path: Path, folder_id: str, display_name: str
+    ) -> Tuple[Path, str, str, Dict]:
+        """
+        Generate the upload URL for a file ahead of sending its bytes.
+
+        Returns:
+            (file_path, folder_id, display_name, upload_info) for _do_upload
+        """
         upload_info = self.generate_upload_url(display_name, folder_id)
+        return file_path, folder_id, display_name, upload_info
+
+    def _do_upload(
+        self, file_path: Path, folder_id: str, display_name: str, upload_info: Dict
+    ) -> bool:
+        """
+        Upload a prepared file and wait for processing.
+
+        Returns:
+            True if successful, False otherwise
+        """
         upload_url = upload_info.get("uploadUrl")
 
         if not upload_url:
@@ -382,14 +656,93 @@ class WixAPIUploader:
             return False
 
         # Upload file
-        if not self.upload_file_to_url(file_path, upload_url, display_name):
+        response = self.upload_file_to_url(file_path, upload_url, display_name)
+        if not response:
             return False
 
-        # Wait a moment for processing
-        time.sleep(2)
+        # The folder's cached file listing no longer matches
+        self._file_cache.pop(self._folder_key(folder_id), None)
+        self._changed_since_publish = True
 
+        # Wait for processing; the new file's ID comes back in the upload
+        # response body (generate-upload-url does not return one)
+        try:
+            file_id = self._json(response).get("file", {}).get("id")
+        except (ValueError, AttributeError):
+            file_id = None
+        if file_id:
+            return self._wait_for_ready(file_id)
+
+        # No file ID to poll - wait a moment instead
+        self.logger.debug(
+            f"No file ID in upload response for {display_name}, waiting 2s instead"
+        )
+        time.sleep(2)
         return True
 
+    def _wait_for_ready(self, file_id: str, timeout: float = 10.0) -> bool:
+        """
+        Poll an uploaded file until Wix has finished processing it.
+
+        Args:
+            file_id: ID of the uploaded file
+            timeout: Maximum seconds to wait
+
+        Returns:
+            False if processing failed, True otherwise (including on timeout)
+        """
+        deadline = time.monotonic() + timeout
+        attempt = 0
+
+        while True:
+            try:
+                response = self._make_request("GET", f"/site-media/v1/files/{file_id}")
+                status = self._json(response).get("file", {}).get("operationStatus")
+                if status == "READY":
+                    return True
+                if status == "FAILED":
+                    self.logger.error(f"❌ Wix failed to process file {file_id}")
+                    return False
+            except requests.RequestException as e:
+                self.logger.debug(f"Status check failed for {file_id}: {e}")
+
+            delay = self.READY_POLL_DELAYS[
+                min(attempt, len(self.READY_POLL_DELAYS) - 1)
+            ]
+            if time.monotonic() + delay > deadline:
+                self.logger.warning(f"⚠️  File {file_id} not ready after {timeout}s")
+                return True
+            time.sleep(delay)
+            attempt += 1
+
+    def upload_files(self, jobs: List[Tuple[Path, str, str]]) -> bool:
+        """
+        Upload several files concurrently.
+
+        Args:
+            jobs: (file_path, folder_id, display_name) tuples
+
+        Returns:
+            True if every upload succeeded
+        """
+        return self._run_uploads(self._prepare_uploads(jobs))
+
+    def _prepare_uploads(
+        self, jobs: List[Tuple[Path, str, str]]
+    ) -> List[Tuple[Path, str, str, Dict]]:
+        """Generate upload URLs for several files concurrently."""
+        workers = min(self.MAX_UPLOAD_WORKERS, len(jobs)) or 1
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            return list(executor.map(lambda job: self._prepare_upload(*job), jobs))
+
+    def _run_uploads(self, prepared: List[Tuple[Path, str, str, Dict]]) -> bool:
+        """Upload several prepared files concurrently."""
+        workers = min(self.MAX_UPLOAD_WORKERS, len(prepared)) or 1
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            results = list(executor.map(lambda item: self._do_upload(*item), prepared))
+
+        return all(results)
+
     def publish_site(self) -> bool:
         """
         Publish the site to make changes live.
@@ -397,11 +750,21 @@ class WixAPIUploader:
         Returns:
             True if successful
         """
+        if (
+            self._last_publish is not None
+            and not self._changed_since_publish
+            and time.monotonic() - self._last_publish < self.PUBLISH_DEDUP_SECONDS
+        ):
+            self.logger.info("⏭️  Site already published, no changes since")
+            return True
+
         self.logger.info("🚀 Publishing site...")
 
         try:
             response = self._make_request("POST", "/site-publisher/v1/site/publish")
 
+            self._last_publish = time.monotonic()
+            self._changed_since_publish = False
             self.logger.info("✅ Site published successfully!")
             return True
 
@@ -415,6 +778,7 @@ class WixAPIUploader:
         overall_pdf: Path,
         week_number: int,
         season_name: str = "SEASON 75 - 2026 Spring",
+        publish: bool = True,
     ) -> bool:
         """
         Complete workflow: upload PDFs to weekly folder and Current/ folder, then publish.
@@ -433,32 +797,36 @@ class WixAPIUploader:
             overall_pdf: Path to Overall PDF
             week_number: Week number (e.g., 9 for Week-09)
             season_name: Season folder name
+            publish: Publish the site at the end (False when batching weeks)
 
         Returns:
             True if entire workflow successful
         """
+        week_folder_name = f"Week-{week_number:02d}"
+        stage = (individual_pdf, overall_pdf, week_number, season_name)
+        used_cached_ids = self._has_folder_ids(season_name)
         try:
-            week_folder_name = f"Week-{week_number:02d}"
-
-            # Ensure season folder exists
-            self.logger.info("📁 Ensuring folder structure exists...")
-            season_folder_id = self.ensure_folder_path([season_name])
-
-            # Ensure Current/ folder exists (for icons to link to)
-            current_folder_id = self.ensure_folder_path([season_name, "Current"])
+            try:
+                current_folder_id, prepared = self._prepare_weekly_uploads(*stage)
+            except Exception as e:
+                if not used_cached_ids:
+                    raise
+
+                # A cached folder may have been deleted in Wix; resolve the
+                # season's folders from the API again and retry once. Only
+                # this stage is retried: no file bytes have been sent yet
+                self.logger.warning(
+                    f"⚠️  Upload prep failed using cached folder IDs, re-resolving: {e}"
+                )
+                self.forget_folder_ids(season_name)
+                self.clear_cache()
+                current_folder_id, prepared = self._prepare_weekly_uploads(*stage)
 
-            # Create/get weekly folder
-            week_folder_id = self.ensure_folder_path([season_name, week_folder_name])
+            archive_uploads, current_uploads = prepared[:2], prepared[2:]
 
             # Upload to weekly folder (archive)
             self.logger.info(f"📤 Uploading to {week_folder_name}/ (archive)...")
-            if not self.upload_file(
-                individual_pdf, week_folder_id, f"Individual-Week{week_number:02d}.pdf"
-            ):
-                return False
-            if not self.upload_file(
-                overall_pdf, week_folder_id, f"Overall-Week{week_number:02d}.pdf"
-            ):
+            if not self._run_uploads(archive_uploads):
                 return False
 
             # Upload to Current/ folder (what icons link to)
@@ -467,20 +835,21 @@ class WixAPIUploader:
             # Delete old files to avoid confusion (keeps only latest files)
             # NOTE: Wix icons link by file ID - deleting creates new IDs
             # MANUAL STEP REQUIRED: Re-link icons in editor after upload (~30 seconds)
-            self.delete_files_by_name(
-                current_folder_id, "Individual.pdf", permanent=True
+            # The old files are gone before the new ones land, so Current/
+            # never holds two files with the same name
+            stale_ids = self.find_file_ids_by_names(
+                current_folder_id, ["Individual.pdf", "Overall.pdf"]
             )
-            self.delete_files_by_name(current_folder_id, "Overall.pdf", permanent=True)
+            if self.delete_files(stale_ids, permanent=True) and stale_ids:
+                self.logger.info(
+                    f"🗑️  Deleted {len(stale_ids)} existing file(s) in Current/"
+                )
 
-            if not self.upload_file(
-                individual_pdf, current_folder_id, "Individual.pdf"
-            ):
-                return False
-            if not self.upload_file(overall_pdf, current_folder_id, "Overall.pdf"):
+            if not self._run_uploads(current_uploads):
                 return False
 
             # Publish site
-            if not self.publish_site():
+            if publish and not self.publish_site():
                 return False
 
             self.logger.info("✅ Upload workflow completed successfully!")
@@ -489,3 +858,73 @@ class WixAPIUploader:
         except Exception as e:
             self.logger.error(f"❌ Upload workflow failed: {e}")
             return False
+
+    def _has_folder_ids(self, root_folder: str) -> bool:
+        """Whether any persisted folder IDs fall under a top-level folder."""
+        prefix = f"{root_folder}/"
+        return any(
+            path == root_folder or path.startswith(prefix) for path in self._folder_ids
+        )
+
+    def _prepare_weekly_uploads(
+        self,
+        individual_pdf: Path,
+        overall_pdf: Path,
+        week_number: int,
+        season_name: str,
+    ) -> Tuple[str, List[Tuple[Path, str, str, Dict]]]:
+        """
+        Resolve the week's folders and generate its four upload URLs.
+
+        Returns:
+            (Current/ folder ID, prepared uploads: two archive then two Current/)
+        """
+        week_folder_name = f"Week-{week_number:02d}"
+
+        # Ensure season folder exists
+        self.logger.info("📁 Ensuring folder structure exists...")
+        season_folder_id = self.ensure_folder_path([season_name])
+
+        # Ensure Current/ folder exists (for icons to link to)
+        current_folder_id = self.ensure_folder_path([season_name, "Current"])
+
+        # Create/get weekly folder
+        week_folder_id = self.ensure_folder_path([season_name, week_folder_name])
+
+        # Generate all four upload URLs up front, concurrently
+        prepared = self._prepare_uploads(
+            [
+                (
+                    individual_pdf,
+                    week_folder_id,
+                    f"Individual-Week{week_number:02d}.pdf",
+                ),
+                (overall_pdf, week_folder_id, f"Overall-Week{week_number:02d}.pdf"),
+                (individual_pdf, current_folder_id, "Individual.pdf"),
+                (overall_pdf, current_folder_id, "Overall.pdf"),
+            ]
+        )
+        return current_folder_id, prepared
+
+    def upload_multiple_weeks(self, week_specs: List[Dict]) -> bool:
+        """
+        Upload several weeks' PDFs, publishing the site once at the end.
+
+        Args:
+            week_specs: upload_weekly_pdfs keyword arguments, one dict per week
+
+        Returns:
+            True if every week uploaded and the site published
+        """
+        success = True
+        for spec in week_specs:
+            if not self.upload_weekly_pdfs(**spec, publish=False):
+                self.logger.error(
+                    f"❌ Upload failed for week {spec.get('week_number')}"
+                )
+                success = False
+
+        if self._changed_since_publish and not self.publish_site():
+            return False
+
+        return success
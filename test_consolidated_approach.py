@@ -8,16 +8,28 @@ equal or better data quality compared to leaderboard-based processing.
 
 import pandas as pd
 import numpy as np
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
+import hashlib
 import json
+import re
 from typing import Dict, Any, List
 import logging
 import pytest
 
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
 from src.config import Config
 from src.data_processor import DataProcessor
 from src.url_fetcher import DartConnectURLFetcher
 
+# Match report path segment, swapped for /games/ to get the game recap URL
+_MATCH_REPORT_RE = re.compile(r'/history/report/match/')
+
 
 def setup_test_logging():
     """Setup logging for testing."""
@@ -29,87 +41,41 @@ def setup_test_logging():
 
 def create_sample_by_leg_data() -> pd.DataFrame:
     """Create sample by_leg export data for testing."""
-    sample_data = [
-        {
-            'Last Name, FI': 'Smith, J',
-            'Date': '2024-01-15',
-            'Game Name': 'Cricket',
-            'Score': 195,
-            'Report Link': 'https://recap.dartconnect.com/history/report/match/68aba095f978cb217a4c5457',
-            'Win': 'Y'
-        },
-        {
-            'Last Name, FI': 'Doe, J',
-            'Date': '2024-01-15',
-            'Game Name': 'Cricket',
-            'Score': 178,
-            'Report Link': 'https://recap.dartconnect.com/history/report/match/68aba095f978cb217a4c5457',
-            'Win': 'N'
-        },
-        {
-            'Last Name, FI': 'Johnson, M',
-            'Date': '2024-01-22',
-            'Game Name': '501',
-            'Score': 132,
-            'Report Link': 'https://recap.dartconnect.com/history/report/match/68ab9f42f978cb217a4c5308',
-            'Win': 'Y'
-        },
-        {
-            'Last Name, FI': 'Wilson, S',
-            'Date': '2024-01-22',
-            'Game Name': '501',
-            'Score': 125,
-            'Report Link': 'https://recap.dartconnect.com/history/report/match/68ab9f42f978cb217a4c5308',
-            'Win': 'N'
-        }
-    ]
-    return pd.DataFrame(sample_data)
+    cricket_link = 'https://recap.dartconnect.com/history/report/match/68aba095f978cb217a4c5457'
+    dart_501_link = 'https://recap.dartconnect.com/history/report/match/68ab9f42f978cb217a4c5308'
+    # Built column-wise so pandas takes each array as a ready-typed column
+    return pd.DataFrame({
+        'Last Name, FI': ['Smith, J', 'Doe, J', 'Johnson, M', 'Wilson, S'],
+        'Date': pd.to_datetime(['2024-01-15'] * 2 + ['2024-01-22'] * 2),
+        'Game Name': pd.Categorical(['Cricket', 'Cricket', '501', '501']),
+        'Score': np.array([195, 178, 132, 125], dtype=np.int32),
+        'Report Link': [cricket_link] * 2 + [dart_501_link] * 2,
+        'Win': pd.Categorical(['Y', 'N', 'Y', 'N'])
+    })
 
 
 def create_sample_cricket_leaderboard() -> pd.DataFrame:
     """Create sample cricket leaderboard data."""
-    sample_data = [
-        {
-            'Player': 'John Smith',
-            'Games': 15,
-            'Avg': 45.2,
-            'PPR': 2.8,
-            'MPR': 1.9,
-            'Pts/Marks': 195
-        },
-        {
-            'Player': 'Jane Doe',
-            'Games': 12,
-            'Avg': 42.1,
-            'PPR': 2.6,
-            'MPR': 1.7,
-            'Pts/Marks': 178
-        }
-    ]
-    return pd.DataFrame(sample_data)
+    return pd.DataFrame({
+        'Player': ['John Smith', 'Jane Doe'],
+        'Games': np.array([15, 12], dtype=np.int32),
+        'Avg': np.array([45.2, 42.1]),
+        'PPR': np.array([2.8, 2.6]),
+        'MPR': np.array([1.9, 1.7]),
+        'Pts/Marks': np.array([195, 178], dtype=np.int32)
+    })
 
 
 def create_sample_501_leaderboard() -> pd.DataFrame:
     """Create sample 501 leaderboard data."""
-    sample_data = [
-        {
-            'Player': 'Mike Johnson',
-            'Games': 18,
-            '3DA': 48.5,
-            'HF': 132,
-            'LF': 89,
-            'CO%': 28.5
-        },
-        {
-            'Player': 'Sarah Wilson',
-            'Games': 16,
-            '3DA': 44.2,
-            'HF': 125,
-            'LF': 82,
-            'CO%': 25.1
-        }
-    ]
-    return pd.DataFrame(sample_data)
+    return pd.DataFrame({
+        'Player': ['Mike Johnson', 'Sarah Wilson'],
+        'Games': np.array([18, 16], dtype=np.int32),
+        '3DA': np.array([48.5, 44.2]),
+        'HF': np.array([132, 125], dtype=np.int32),
+        'LF': np.array([89, 82], dtype=np.int32),
+        'CO%': np.array([28.5, 25.1])
+    })
 
 
 def save_test_files(test_dir: Path) -> Dict[str, Path]:
@@ -127,21 +93,53 @@ def save_test_files(test_dir: Path) -> Dict[str, Path]:
         'dart_501': test_dir / 'test_501_leaderboard.csv'
     }
     
-    by_leg_data.to_csv(files['by_leg'], index=False)
-    cricket_data.to_csv(files['cricket'], index=False)
-    dart_501_data.to_csv(files['dart_501'], index=False)
-    
+    frames = {'by_leg': by_leg_data, 'cricket': cricket_data, 'dart_501': dart_501_data}
+    
+    # Skip rewriting unchanged fixtures: a signature of the sample data is kept
+    # next to them and the files are only regenerated when it differs
+    signature = _sample_signature(frames)
+    sig_file = test_dir / '.sample_data.sig'
+    if (all(path.exists() for path in files.values())
+            and sig_file.exists() and sig_file.read_text() == signature):
+        return files
+    
+    # The three writes are independent, so run them side by side; CSV is kept
+    # because DataProcessor.process_file only reads CSV/Excel
+    with ThreadPoolExecutor(max_workers=len(frames)) as executor:
+        for future in [
+            executor.submit(df.to_csv, files[name], index=False, lineterminator='\n')
+            for name, df in frames.items()
+        ]:
+            future.result()
+    
+    sig_file.write_text(signature)
     return files
 
 
+def _sample_signature(frames: Dict[str, pd.DataFrame]) -> str:
+    """Hash the sample frames' names, columns, dtypes and values."""
+    digest = hashlib.md5()
+    for name, df in frames.items():
+        digest.update(f"{name}:{list(df.columns)}:{list(df.dtypes.astype(str))}".encode())
+        digest.update(pd.util.hash_pandas_object(df, index=True).values.tobytes())
+    return digest.hexdigest()
+
+
 @pytest.fixture
 def test_files(tmp_path):
     """Pytest fixture that creates sample test data files in a temporary directory."""
     return save_test_files(tmp_path)
 
 
-def test_url_processing_capability():
-    """Test the URL processing capability with sample URLs."""
+@pytest.fixture(autouse=True)
+def offline_fetcher(monkeypatch):
+    """Keep pytest runs off the network: game data comes from the disk cache only."""
+    monkeypatch.setattr(DartConnectURLFetcher, '_load_game_data',
+                        lambda self, url: self._get_cached_data(url))
+
+
+def run_url_processing_capability() -> List[Dict]:
+    """Fetch the sample URLs and report per-URL processing results."""
     print("🔗 Testing URL Processing Capability")
     print("-" * 40)
     
@@ -153,15 +151,20 @@ def test_url_processing_capability():
     fetcher = DartConnectURLFetcher()
     results = []
     
-    for i, url in enumerate(sample_urls, 1):
+    # Convert to game URL format
+    game_urls = [_MATCH_REPORT_RE.sub('/games/', url) for url in sample_urls]
+    
+    # Fetch the URLs concurrently up front (cached ones never hit the
+    # network); only the network calls run in parallel, the checks below
+    # stay serial
+    fetched = fetcher.fetch_many(game_urls)
+    
+    for i, game_url in enumerate(game_urls, 1):
         print(f"\n🎯 Test URL {i}: Testing URL processing")
-        
-        # Convert to game URL format
-        game_url = url.replace('/history/report/match/', '/games/')
         print(f"   Converted URL: {game_url}")
         
         try:
-            game_data = fetcher.fetch_game_data(game_url)
+            game_data = fetched.get(game_url)
             if game_data:
                 print("   ✅ Successfully fetched game data")
                 
@@ -197,8 +200,17 @@ def test_url_processing_capability():
     return results
 
 
-def test_data_processing_comparison(test_files: Dict[str, Path]):
-    """Compare processing results between by_leg and leaderboard approaches."""
+def test_url_processing_capability():
+    """Test the URL processing capability with sample URLs."""
+    results = run_url_processing_capability()
+    
+    # Fetches may fail offline, but every sample URL gets a result
+    assert len(results) == 2
+    assert all('/games/' in r['url'] and 'success' in r for r in results)
+
+
+def run_data_processing_comparison(test_files: Dict[str, Path]) -> Dict[str, Any]:
+    """Process the sample files and collect results for each approach."""
     print("\n📊 Testing Data Processing Comparison")
     print("-" * 45)
     
@@ -258,6 +270,14 @@ def test_data_processing_comparison(test_files: Dict[str, Path]):
     return results_comparison
 
 
+def test_data_processing_comparison(test_files: Dict[str, Path]):
+    """Compare processing results between by_leg and leaderboard approaches."""
+    comparison = run_data_processing_comparison(test_files)
+    
+    for key in ('by_leg_results', 'cricket_results', 'dart_501_results'):
+        assert comparison[key] is not None, f"{key} failed to process"
+
+
 def analyze_data_quality_comparison(comparison: Dict[str, Any]):
     """Analyze and compare data quality between different approaches."""
     print("\n🔍 Data Quality Comparison Analysis")
@@ -277,23 +297,28 @@ def analyze_data_quality_comparison(comparison: Dict[str, Any]):
     if by_leg:
         print("📊 By_Leg Export Analysis:")
         
-        # Check for enhanced data features
+        # Look everything up once
         enhanced_data = by_leg.get('enhanced_data', {})
-        if enhanced_data.get('urls_processed', 0) > 0:
+        urls_processed = enhanced_data.get('urls_processed', 0)
+        cricket_qp = enhanced_data.get('cricket_qp_data')
+        raw_data = by_leg.get('raw_data')
+        columns = set(raw_data.columns) if raw_data is not None else set()
+        
+        # Check for enhanced data features
+        if urls_processed > 0:
             analysis['by_leg_score'] += 30
             analysis['advantages'].append("✅ URL processing provides detailed game data")
         
-        if enhanced_data.get('cricket_qp_data'):
+        if cricket_qp:
             analysis['by_leg_score'] += 25
             analysis['advantages'].append("✅ Enhanced Cricket QPs with Bulls data")
         
         # Check for game-level data
-        raw_data = by_leg.get('raw_data')
-        if raw_data is not None and 'game_name' in raw_data.columns:
+        if 'game_name' in columns:
             analysis['by_leg_score'] += 15
             analysis['advantages'].append("✅ Game-by-game tracking available")
         
-        if 'game_date' in raw_data.columns if raw_data is not None else False:
+        if 'game_date' in columns:
             analysis['by_leg_score'] += 10
             analysis['advantages'].append("✅ Exact game dates available")
         
@@ -354,12 +379,28 @@ def analyze_data_quality_comparison(comparison: Dict[str, Any]):
     return analysis
 
 
+def _coerce(value: Any) -> Any:
+    """JSON default for report scalars; anything else (e.g. DataFrames) is stringified."""
+    if isinstance(value, (pd.Timestamp, np.datetime64)):
+        # datetime64.item() can return a bare int, so go through Timestamp
+        return pd.Timestamp(value).isoformat()
+    if isinstance(value, np.generic):
+        return value.item()
+    if hasattr(value, 'isoformat'):  # datetime, date
+        return value.isoformat()
+    return str(value)
+
+
 def generate_test_report(url_results: List[Dict], comparison: Dict[str, Any], quality_analysis: Dict[str, Any]):
     """Generate a comprehensive test report."""
+    success = np.fromiter(
+        (bool(r.get('success', False)) for r in url_results), dtype=np.bool_, count=len(url_results)
+    )
     report = {
         'test_summary': {
             'timestamp': pd.Timestamp.now().isoformat(),
-            'url_processing_success_rate': sum(1 for r in url_results if r.get('success', False)) / len(url_results) * 100,
+            'url_processing_success_rate': float(success.mean()) * 100 if len(success) else 0.0,
+            'url_processing_failed': int((~success).sum()),
             'by_leg_quality_score': quality_analysis['by_leg_score'],
             'leaderboard_quality_score': quality_analysis['leaderboard_score']
         },
@@ -375,8 +416,15 @@ def generate_test_report(url_results: List[Dict], comparison: Dict[str, Any], qu
     
     # Save test report
     test_report_file = Path('test_consolidated_results.json')
-    with open(test_report_file, 'w') as f:
-        json.dump(report, f, indent=2, default=str)
+    if ORJSON_AVAILABLE:
+        # orjson handles numpy values natively; anything else (DataFrames,
+        # timestamps) still goes through _coerce
+        options = orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS
+        with open(test_report_file, 'wb') as f:
+            f.write(orjson.dumps(report, option=options, default=_coerce))
+    else:
+        with open(test_report_file, 'w') as f:
+            json.dump(report, f, indent=2, default=_coerce)
     
     print(f"\n📄 Test report saved: {test_report_file}")
     return report
@@ -430,10 +478,10 @@ def main():
     
     try:
         # Test 1: URL processing capability
-        url_results = test_url_processing_capability()
+        url_results = run_url_processing_capability()
         
         # Test 2: Data processing comparison
-        comparison = test_data_processing_comparison(test_files)
+        comparison = run_data_processing_comparison(test_files)
         
         # Test 3: Quality analysis
         quality_analysis = analyze_data_quality_comparison(comparison)
@@ -3,6 +3,9 @@
 Test script to generate Overall PDF with sample data to check formatting.
 """
 
+import numpy as np
+import pandas as pd
+
 from src.config import Config
 from src.pdf_generator import PDFGenerator
 
@@ -13,101 +16,44 @@ sample_data = {
     'derived_metrics': {},
 }
 
+# Sample Winston Division players, one row per player, stored column-wise so
+# totals and percentages can be computed on the numeric columns directly
+SAMPLE_PLAYERS = pd.DataFrame({
+    "team": ["DARK HORSE"] * 3 + ["KBTN"] * 2,
+    "name": ["Danny Roark", "Jeff Maelin", "Cissy Mealin", "James Shelton", "Ellen Lee"],
+    "legs": np.array([93, 39, 41, 84, 58], dtype=np.int16),
+    "games": np.array([39, 16, 18, 37, 24], dtype=np.int16),
+    "qualify": np.array([0, 2, 0, 0, 0], dtype=np.int16),
+    "eligibility": ["QUALIFIED", "INELIGIBLE", "QUALIFIED", "QUALIFIED", "QUALIFIED"],
+    "s01_w": np.array([5, 1, 4, 5, 5], dtype=np.int16),
+    "s01_l": np.array([6, 0, 2, 4, 3], dtype=np.int16),
+    "sc_w": np.array([5, 4, 3, 6, 1], dtype=np.int16),
+    "sc_l": np.array([4, 4, 0, 4, 4], dtype=np.int16),
+    "d01_w": np.array([2, 0, 1, 5, 7], dtype=np.int16),
+    "d01_l": np.array([7, 3, 4, 4, 1], dtype=np.int16),
+    "dc_w": np.array([7, 2, 3, 6, 1], dtype=np.int16),
+    "dc_l": np.array([3, 2, 1, 3, 2], dtype=np.int16),
+    "total_w": np.array([19, 7, 11, 22, 14], dtype=np.int16),
+    "total_l": np.array([20, 9, 7, 15, 10], dtype=np.int16),
+    "win_pct": ["48.72%", "43.75%", "61.11%", "59.46%", "58.33%"],
+    "qps": np.array([108, 30, 23, 118, 26], dtype=np.int16),
+    "qp_pct": ["116.13%", "76.92%", "56.10%", "140.48%", "44.83%"],
+    "rating": ["2.1356", "1.6442", "1.7832", "2.5940", "1.6149"],
+})
+
+
+def as_team_dicts(players):
+    """Convert the columnar player table into the team dicts the PDF generator expects."""
+    return [
+        {"name": team, "players": group.drop(columns="team").to_dict("records")}
+        for team, group in players.groupby("team", sort=False)
+    ]
+
+
 # Create sample teams for testing
 def get_sample_teams():
     """Sample teams for Winston Division to test formatting."""
-    return [
-        {
-            "name": "DARK HORSE",
-            "players": [
-                {
-                    "name": "Danny Roark",
-                    "legs": 93,
-                    "games": 39,
-                    "qualify": 0,
-                    "eligibility": "QUALIFIED",
-                    "s01_w": 5, "s01_l": 6,
-                    "sc_w": 5, "sc_l": 4,
-                    "d01_w": 2, "d01_l": 7,
-                    "dc_w": 7, "dc_l": 3,
-                    "total_w": 19, "total_l": 20,
-                    "win_pct": "48.72%",
-                    "qps": 108,
-                    "qp_pct": "116.13%",
-                    "rating": "2.1356"
-                },
-                {
-                    "name": "Jeff Maelin",
-                    "legs": 39,
-                    "games": 16,
-                    "qualify": 2,
-                    "eligibility": "INELIGIBLE",
-                    "s01_w": 1, "s01_l": 0,
-                    "sc_w": 4, "sc_l": 4,
-                    "d01_w": 0, "d01_l": 3,
-                    "dc_w": 2, "dc_l": 2,
-                    "total_w": 7, "total_l": 9,
-                    "win_pct": "43.75%",
-                    "qps": 30,
-                    "qp_pct": "76.92%",
-                    "rating": "1.6442"
-                },
-                {
-                    "name": "Cissy Mealin",
-                    "legs": 41,
-                    "games": 18,
-                    "qualify": 0,
-                    "eligibility": "QUALIFIED",
-                    "s01_w": 4, "s01_l": 2,
-                    "sc_w": 3, "sc_l": 0,
-                    "d01_w": 1, "d01_l": 4,
-                    "dc_w": 3, "dc_l": 1,
-                    "total_w": 11, "total_l": 7,
-                    "win_pct": "61.11%",
-                    "qps": 23,
-                    "qp_pct": "56.10%",
-                    "rating": "1.7832"
-                }
-            ]
-        },
-        {
-            "name": "KBTN",
-            "players": [
-                {
-                    "name": "James Shelton",
-                    "legs": 84,
-                    "games": 37,
-                    "qualify": 0,
-                    "eligibility": "QUALIFIED",
-                    "s01_w": 5, "s01_l": 4,
-                    "sc_w": 6, "sc_l": 4,
-                    "d01_w": 5, "d01_l": 4,
-                    "dc_w": 6, "dc_l": 3,
-                    "total_w": 22, "total_l": 15,
-                    "win_pct": "59.46%",
-                    "qps": 118,
-                    "qp_pct": "140.48%",
-                    "rating": "2.5940"
-                },
-                {
-                    "name": "Ellen Lee",
-                    "legs": 58,
-                    "games": 24,
-                    "qualify": 0,
-                    "eligibility": "QUALIFIED",
-                    "s01_w": 5, "s01_l": 3,
-                    "sc_w": 1, "sc_l": 4,
-                    "d01_w": 7, "d01_l": 1,
-                    "dc_w": 1, "dc_l": 2,
-                    "total_w": 14, "total_l": 10,
-                    "win_pct": "58.33%",
-                    "qps": 26,
-                    "qp_pct": "44.83%",
-                    "rating": "1.6149"
-                }
-            ]
-        }
-    ]
+    return as_team_dicts(SAMPLE_PLAYERS)
 
 # Patch the _get_division_teams method to return our sample data
 def patched_get_division_teams(self, data, division_name):
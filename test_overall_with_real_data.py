@@ -3,18 +3,17 @@
 Test script to generate Overall PDF with REAL data from CSV.
 """
 
-from src.config import Config
-from src.data_processor import DataProcessor
+import os
+import sys
+
+import pytest
+
 from src.pdf_generator import PDFGenerator
 
-if __name__ == "__main__":
+
+def test_overall_pdf(config, results):
+    """Generate the Overall PDF from the processed real data."""
     print("🔄 Processing real CSV data...")
-    config = Config()
-    processor = DataProcessor(config)
-    
-    # Process the real data
-    results = processor.process_file("data/season74/by_leg_export.csv")
-    
     print(f"✅ Processed {len(results['raw_data'])} rows")
     print(f"📊 Found {results['raw_data']['Team'].nunique()} teams")
     print(f"👥 Found {results['raw_data']['player_name'].nunique()} players")
@@ -31,16 +30,11 @@ if __name__ == "__main__":
     print("\n🎨 Generating Overall PDF...")
     generator = PDFGenerator(config, output_dir="output")
     
-    try:
-        pdf_path = generator.generate_overall_report(results)
-        print(f"\n✅ PDF generated successfully!")
-        print(f"📄 Location: {pdf_path}")
-        print(f"\n💡 Opening PDF...")
-        
-        import subprocess
-        subprocess.run(["open", pdf_path])
-        
-    except Exception as e:
-        print(f"\n❌ Error generating PDF: {e}")
-        import traceback
-        traceback.print_exc()
+    pdf_path = generator.generate_overall_report(results)
+    print(f"\n✅ PDF generated successfully!")
+    print(f"📄 Location: {pdf_path}")
+    assert os.path.exists(pdf_path)
+
+
+if __name__ == "__main__":
+    sys.exit(pytest.main([__file__, "-s"]))